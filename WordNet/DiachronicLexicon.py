@@ -0,0 +1,320 @@
+from __future__ import annotations
+
+import os
+import re
+import struct
+import sys
+from array import array
+
+
+class DiachronicLexicon:
+    """
+    Merges historical dictionaries, such as turkish1901_dictionary.txt through turkish1998_dictionary.txt, into one
+    index of the years each word appears in and the flags it has in each of those years. Every word keeps a bitmask of
+    its years and one interned flag set per year, so identical flag sets like {CL_ISIM} are stored once for all words.
+    """
+
+    MAGIC = b"KENETDL1"
+    HEADER = struct.Struct("<8sIIIII")
+
+    __years: list
+    __words: list
+    __word_indices: dict
+    __masks: array
+    __flag_offsets: array
+    __flag_set_ids: array
+    __flag_sets: list
+    __last_words = None
+
+    def __init__(self, fileNames: list = None):
+        """
+        Reads the specified dictionary files. The year of a dictionary is the four digit number in its file name, and
+        every line of a dictionary is a word followed by its flags.
+
+        PARAMETERS
+        ----------
+        fileNames : list
+            Dictionary files to be read, such as ["turkish1901_dictionary.txt", "turkish1944_dictionary.txt"]
+
+        RAISES
+        ------
+        ValueError
+            If a file name has no year, two files have the same year or there are more than 32 years
+        """
+        dictionaries = {}
+        if fileNames is not None:
+            for file_name in fileNames:
+                match = re.search(r"\d{4}", os.path.basename(file_name))
+                if match is None:
+                    raise ValueError("No year in the dictionary file name " + file_name)
+                year = int(match.group())
+                if year in dictionaries:
+                    raise ValueError("Two dictionaries for the year " + str(year))
+                dictionaries[year] = file_name
+        if len(dictionaries) > 32:
+            raise ValueError("At most 32 dictionaries can be merged")
+        self.__years = sorted(dictionaries)
+        flag_set_ids = {}
+        self.__flag_sets = []
+        entries = {}
+        for year_index, year in enumerate(self.__years):
+            bit = 1 << year_index
+            input_file = open(dictionaries[year], "r", encoding="utf8")
+            for line in input_file:
+                word, _, flags = line.strip().partition(" ")
+                if len(word) == 0:
+                    continue
+                flag_set_id = flag_set_ids.get(flags)
+                if flag_set_id is None:
+                    flag_set_id = self.__internFlags(frozenset(flags.split()), flag_set_ids)
+                    flag_set_ids[flags] = flag_set_id
+                entry = entries.get(word)
+                if entry is None:
+                    entries[word] = [bit, flag_set_id]
+                elif entry[0] & bit:
+                    entry[-1] = self.__internFlags(self.__flag_sets[entry[-1]] | self.__flag_sets[flag_set_id],
+                                                   flag_set_ids)
+                else:
+                    entry[0] |= bit
+                    entry.append(flag_set_id)
+            input_file.close()
+        self.__words = sorted(entries)
+        self.__word_indices = {word: index for index, word in enumerate(self.__words)}
+        self.__masks = array("I")
+        self.__flag_offsets = array("I", [0])
+        self.__flag_set_ids = array("H")
+        for word in self.__words:
+            entry = entries[word]
+            self.__masks.append(entry[0])
+            self.__flag_set_ids.extend(entry[1:])
+            self.__flag_offsets.append(len(self.__flag_set_ids))
+
+    def __internFlags(self,
+                      flags: frozenset,
+                      flagSetIds: dict) -> int:
+        """
+        Returns the ID of a flag set, adding it to the flag sets if it is new. flagSetIds maps both the flag sets and
+        the flag strings read from the files to their IDs.
+        """
+        flag_set_id = flagSetIds.get(flags)
+        if flag_set_id is None:
+            flag_set_id = len(self.__flag_sets)
+            flagSetIds[flags] = flag_set_id
+            self.__flag_sets.append(flags)
+        return flag_set_id
+
+    @staticmethod
+    def fromBinary(fileName: str) -> DiachronicLexicon:
+        """
+        Creates a lexicon from a binary file written by saveBinary.
+
+        PARAMETERS
+        ----------
+        fileName : str
+            Binary file to be read
+
+        RETURNS
+        -------
+        DiachronicLexicon
+            Lexicon stored in the file
+
+        RAISES
+        ------
+        ValueError
+            If the file is not a diachronic lexicon file
+        """
+        with open(fileName, "rb") as input_file:
+            data = input_file.read()
+        magic, year_count, word_count, flag_count, flag_set_count, string_length = \
+            DiachronicLexicon.HEADER.unpack_from(data, 0)
+        if magic != DiachronicLexicon.MAGIC:
+            raise ValueError(fileName + " is not a diachronic lexicon file")
+        position = DiachronicLexicon.HEADER.size
+        strings = data[position: position + string_length].decode("utf8").split("\n")
+        position += string_length
+        flags = strings[:flag_count]
+        lexicon = DiachronicLexicon()
+        lexicon.__words = strings[flag_count: flag_count + word_count]
+        lexicon.__word_indices = {word: index for index, word in enumerate(lexicon.__words)}
+        years, position = DiachronicLexicon.__readArray(data, position, "H", year_count)
+        lexicon.__years = years.tolist()
+        flag_set_offsets, position = DiachronicLexicon.__readArray(data, position, "I", flag_set_count + 1)
+        flag_set_members, position = DiachronicLexicon.__readArray(data, position, "H",
+                                                                   flag_set_offsets[flag_set_count])
+        lexicon.__flag_sets = [frozenset(flags[member] for member in
+                                         flag_set_members[flag_set_offsets[i]: flag_set_offsets[i + 1]])
+                               for i in range(flag_set_count)]
+        lexicon.__masks, position = DiachronicLexicon.__readArray(data, position, "I", word_count)
+        lexicon.__flag_offsets, position = DiachronicLexicon.__readArray(data, position, "I", word_count + 1)
+        lexicon.__flag_set_ids, position = DiachronicLexicon.__readArray(data, position, "H",
+                                                                         lexicon.__flag_offsets[word_count])
+        return lexicon
+
+    @staticmethod
+    def __readArray(data: bytes,
+                    position: int,
+                    typeCode: str,
+                    size: int) -> tuple:
+        values = array(typeCode)
+        end = position + size * values.itemsize
+        values.frombytes(data[position: end])
+        if sys.byteorder != "little":
+            values.byteswap()
+        return values, end
+
+    def saveBinary(self, fileName: str):
+        """
+        Saves the lexicon to a binary file read by fromBinary, which loads much faster than the dictionary files.
+
+        PARAMETERS
+        ----------
+        fileName : str
+            Binary file to write the lexicon
+        """
+        flags = sorted(set().union(*self.__flag_sets))
+        flag_indices = {flag: index for index, flag in enumerate(flags)}
+        flag_set_offsets = array("I", [0])
+        flag_set_members = array("H")
+        for flag_set in self.__flag_sets:
+            flag_set_members.extend(sorted(flag_indices[flag] for flag in flag_set))
+            flag_set_offsets.append(len(flag_set_members))
+        strings = "\n".join(flags + self.__words).encode("utf8")
+        with open(fileName, "wb") as output_file:
+            output_file.write(DiachronicLexicon.HEADER.pack(DiachronicLexicon.MAGIC, len(self.__years),
+                                                            len(self.__words), len(flags), len(self.__flag_sets),
+                                                            len(strings)))
+            output_file.write(strings)
+            for values in (array("H", self.__years), flag_set_offsets, flag_set_members, self.__masks,
+                           self.__flag_offsets, self.__flag_set_ids):
+                if sys.byteorder != "little":
+                    values = array(values.typecode, values)
+                    values.byteswap()
+                output_file.write(values.tobytes())
+
+    def getYears(self) -> list:
+        """
+        Returns the years of the merged dictionaries.
+
+        RETURNS
+        -------
+        list
+            Years of the dictionaries in increasing order
+        """
+        return list(self.__years)
+
+    def size(self) -> int:
+        """
+        Returns the number of distinct words in the merged dictionaries.
+
+        RETURNS
+        -------
+        int
+            Number of words
+        """
+        return len(self.__words)
+
+    def flagSetSize(self) -> int:
+        """
+        Returns the number of distinct flag sets shared by the words.
+
+        RETURNS
+        -------
+        int
+            Number of interned flag sets
+        """
+        return len(self.__flag_sets)
+
+    def yearsOf(self, word: str) -> list:
+        """
+        Returns the years of the dictionaries containing a word.
+
+        PARAMETERS
+        ----------
+        word : str
+            Word to be searched
+
+        RETURNS
+        -------
+        list
+            Years of the dictionaries containing the word in increasing order, empty if no dictionary contains it
+        """
+        index = self.__word_indices.get(word)
+        if index is None:
+            return []
+        mask = self.__masks[index]
+        return [year for year_index, year in enumerate(self.__years) if mask & (1 << year_index)]
+
+    def flagsOf(self,
+                word: str,
+                year: int) -> frozenset:
+        """
+        Returns the flags of a word in the dictionary of a year.
+
+        PARAMETERS
+        ----------
+        word : str
+            Word to be searched
+        year : int
+            Year of the dictionary
+
+        RETURNS
+        -------
+        frozenset
+            Flags of the word such as IS_OA and CL_ISIM, None if the dictionary of the year does not contain the word
+        """
+        index = self.__word_indices.get(word)
+        if index is None or year not in self.__years:
+            return None
+        bit = 1 << self.__years.index(year)
+        mask = self.__masks[index]
+        if not mask & bit:
+            return None
+        position = self.__flag_offsets[index] + bin(mask & (bit - 1)).count("1")
+        return self.__flag_sets[self.__flag_set_ids[position]]
+
+    def __lastWords(self) -> list:
+        """
+        Groups the words by the index of the last year containing them, built on the first call.
+        """
+        if self.__last_words is None:
+            self.__last_words = [[] for _ in self.__years]
+            for word, mask in zip(self.__words, self.__masks):
+                self.__last_words[mask.bit_length() - 1].append(word)
+        return self.__last_words
+
+    def literalsAbsentSince(self,
+                            year: int,
+                            literals=None) -> list:
+        """
+        Returns the words that appear in a dictionary before the specified year but in no dictionary of that year or
+        later, such as the words dropped from the language after a spelling reform.
+
+        PARAMETERS
+        ----------
+        year : int
+            First year the words are absent
+        literals
+            Iterable of literal names, such as WordNet.literalList(), to restrict the result to. If None, all words of
+            the dictionaries are considered.
+
+        RETURNS
+        -------
+        list
+            Words absent since the year in alphabetical order
+        """
+        if literals is not None:
+            last = 1 << sum(1 for dictionary_year in self.__years if dictionary_year < year)
+            result = []
+            for literal in set(literals):
+                index = self.__word_indices.get(literal)
+                if index is not None and self.__masks[index] < last:
+                    result.append(literal)
+            return sorted(result)
+        last_words = self.__lastWords()
+        result = []
+        for year_index, dictionary_year in enumerate(self.__years):
+            if dictionary_year >= year:
+                break
+            result.extend(last_words[year_index])
+        result.sort()
+        return result
@@ -1,24 +1,136 @@
+from __future__ import annotations
+
+import struct
+import sys
+from array import array
+
+
 class IdMapping:
 
+    MAGIC = b"KENETMP3"
+    HEADER = struct.Struct("<8sI?I")
+
     __map: dict
+    __compiled: dict
 
     def __init__(self, fileName=None):
         """
-        Constructor to load ID mappings from given file to a map.
+        Constructor to load ID mappings from given file to a map. Every line of the file is a key and its value
+        separated by "->", empty lines are ignored.
 
         PARAMETERS
         ----------
         fileName : str
             String file name input that will be read
+
+        RAISES
+        ------
+        ValueError
+            If a line is not a single key and value separated by "->"
         """
         self.__map = {}
+        self.__compiled = None
         if fileName is not None:
             input_file = open(fileName, "r", encoding="utf8")
-            lines = input_file.readlines()
-            input_file.close()
-            for line in lines:
+            for line_number, line in enumerate(input_file, 1):
+                line = line.rstrip("\r\n")
+                if len(line) == 0:
+                    continue
                 items = line.split("->")
+                if len(items) != 2:
+                    input_file.close()
+                    raise ValueError("Malformed ID mapping at line " + str(line_number) + " of " + fileName + ": " +
+                                     line)
                 self.__map[items[0]] = items[1]
+            input_file.close()
+
+    @staticmethod
+    def fromBinary(fileName: str) -> IdMapping:
+        """
+        Creates an ID mapping from a binary file written by saveBinary. The file holds a table of the distinct IDs
+        followed by the pairs of table indexes of the keys and values and, for a compiled map, the table indexes of the
+        ends of the chains of the keys.
+
+        PARAMETERS
+        ----------
+        fileName : str
+            Binary file to be read
+
+        RETURNS
+        -------
+        IdMapping
+            ID mapping stored in the file, already compiled if it was saved compiled
+
+        RAISES
+        ------
+        ValueError
+            If the file is not an ID mapping file
+        """
+        with open(fileName, "rb") as input_file:
+            data = input_file.read()
+        magic, count, compiled, string_length = IdMapping.HEADER.unpack_from(data, 0)
+        if magic != IdMapping.MAGIC:
+            raise ValueError(fileName + " is not an ID mapping file")
+        id_mapping = IdMapping()
+        if count > 0:
+            position = IdMapping.HEADER.size
+            strings = data[position: position + string_length].decode("utf8").split("\n")
+            position += string_length
+            indexes = array("I")
+            if compiled:
+                indexes.frombytes(data[position: position + 3 * count * indexes.itemsize])
+            else:
+                indexes.frombytes(data[position: position + 2 * count * indexes.itemsize])
+            if sys.byteorder != "little":
+                indexes.byteswap()
+            keys = list(map(strings.__getitem__, indexes[0: 2 * count: 2]))
+            id_mapping.__map = dict(zip(keys, map(strings.__getitem__, indexes[1: 2 * count: 2])))
+            if compiled:
+                id_mapping.__compiled = dict(zip(keys, map(strings.__getitem__, indexes[2 * count:])))
+        elif compiled:
+            id_mapping.__compiled = {}
+        return id_mapping
+
+    def compile(self):
+        """
+        Resolves every chain of mappings once, so that map needs a single dictionary access until the mapping is
+        changed. Every ID on a chain is resolved together with the chain, later chains stop at the first ID already
+        resolved.
+
+        RAISES
+        ------
+        ValueError
+            If the mappings contain a cycle
+        """
+        compiled = {}
+        for key in self.__map:
+            if key in compiled:
+                continue
+            chain = [key]
+            on_chain = {key}
+            mapped_id = self.__map[key]
+            while mapped_id in self.__map and mapped_id not in compiled:
+                if mapped_id in on_chain:
+                    raise ValueError("ID mapping cycle: " + " -> ".join(chain[chain.index(mapped_id):] + [mapped_id]))
+                chain.append(mapped_id)
+                on_chain.add(mapped_id)
+                mapped_id = self.__map[mapped_id]
+            if mapped_id in compiled:
+                mapped_id = compiled[mapped_id]
+            for chain_id in chain:
+                compiled[chain_id] = mapped_id
+        self.__compiled = compiled
+
+    def isCompiled(self) -> bool:
+        """
+        Checks whether the chains of the mapping are resolved and not changed since.
+
+        RETURNS
+        -------
+        bool
+            True if the mapping is compiled, False otherwise
+        """
+        return self.__compiled is not None
 
     def keySet(self) -> set:
         """
@@ -34,6 +146,7 @@ class IdMapping:
     def map(self, _id: str) -> str:
         """
         Returns the value to which the specified key is mapped, or None if this map contains no mapping for the key.
+        Values that are keys themselves are followed until the end of the chain.
 
         PARAMETERS
         ----------
@@ -44,11 +157,22 @@ class IdMapping:
         -------
         str
             Value of the specified key
+
+        RAISES
+        ------
+        ValueError
+            If the chain starting from the key is a cycle
         """
+        if self.__compiled is not None:
+            return self.__compiled.get(_id)
         if _id not in self.__map:
             return None
+        visited = {_id}
         mapped_id = self.__map[_id]
         while mapped_id in self.__map:
+            if mapped_id in visited:
+                raise ValueError("ID mapping cycle at " + mapped_id)
+            visited.add(mapped_id)
             mapped_id = self.__map[mapped_id]
         return mapped_id
 
@@ -80,6 +204,7 @@ class IdMapping:
             value to be associated with the specified key
         """
         self.__map[key] = value
+        self.__compiled = None
 
     def remove(self, key: str):
         """
@@ -91,6 +216,7 @@ class IdMapping:
             key whose mapping is to be removed from the map
         """
         self.__map.pop(key)
+        self.__compiled = None
 
     def save(self, fileName: str):
         """
@@ -105,3 +231,43 @@ class IdMapping:
         for key in self.__map:
             outfile.write(key + "->" + self.__map[key] + "\n")
         outfile.close()
+
+    @staticmethod
+    def __stringIndex(_id: str, stringIndexes: dict) -> int:
+        """
+        Returns the index of an ID in the string table of saveBinary, adding the ID to the table if it is new.
+        """
+        index = stringIndexes.get(_id)
+        if index is None:
+            index = len(stringIndexes)
+            stringIndexes[_id] = index
+        return index
+
+    def saveBinary(self, fileName: str):
+        """
+        Saves the map to a binary file read by fromBinary. Every distinct ID is stored once in a string table and the
+        mappings as pairs of unsigned 32 bit table indexes, so an ID shared by many keys, such as the end of a chain,
+        takes four bytes per use. A compiled map is saved together with the resolved ends of its chains, so it is
+        loaded compiled while singleMap and save still see the single mappings.
+
+        PARAMETERS
+        ----------
+        fileName : str
+            Binary file to write map
+        """
+        string_indexes = {}
+        indexes = array("I")
+        for key, value in self.__map.items():
+            for _id in (key, value):
+                indexes.append(IdMapping.__stringIndex(_id, string_indexes))
+        if self.__compiled is not None:
+            for key in self.__map:
+                indexes.append(IdMapping.__stringIndex(self.__compiled[key], string_indexes))
+        strings = "\n".join(string_indexes).encode("utf8")
+        if sys.byteorder != "little":
+            indexes.byteswap()
+        with open(fileName, "wb") as output_file:
+            output_file.write(IdMapping.HEADER.pack(IdMapping.MAGIC, len(self.__map), self.__compiled is not None,
+                                                    len(strings)))
+            output_file.write(strings)
+            output_file.write(indexes.tobytes())
@@ -0,0 +1,104 @@
+from WordNet.IdiomTrieNode import IdiomTrieNode
+
+
+class IdiomTrie:
+    """
+    Word level prefix tree over the multi-word literal names of a WordNet, such as "bir iğne bir iplik olmak". Every
+    edge is one word of a literal, so a sequence of words can be abandoned as soon as no literal starts with it.
+    """
+
+    __root: IdiomTrieNode
+    __size: int
+
+    def __init__(self, literals=None):
+        """
+        Creates a trie with the multi-word names among the specified literal names, single word names are skipped.
+
+        PARAMETERS
+        ----------
+        literals
+            Iterable of literal names
+        """
+        self.__root = IdiomTrieNode()
+        self.__size = 0
+        if literals is not None:
+            for literal in literals:
+                self.addLiteral(literal)
+
+    def addLiteral(self, literal: str):
+        """
+        Adds a literal name to the trie if it has more than one word.
+
+        PARAMETERS
+        ----------
+        literal : str
+            Literal name to be added
+        """
+        words = literal.split(" ")
+        if len(words) < 2:
+            return
+        node = self.__root
+        for word in words:
+            node = node.addChild(word)
+        if node.getLiteral() is None:
+            node.setLiteral(literal)
+            self.__size = self.__size + 1
+
+    def getRoot(self) -> IdiomTrieNode:
+        """
+        Accessor for the root of the trie, the children of the root are the first words of the literals.
+
+        RETURNS
+        -------
+        IdiomTrieNode
+            Root of the trie
+        """
+        return self.__root
+
+    def getNode(self, words: list) -> IdiomTrieNode:
+        """
+        Returns the node reached by following the specified words from the root.
+
+        PARAMETERS
+        ----------
+        words : list
+            Words to follow
+
+        RETURNS
+        -------
+        IdiomTrieNode
+            Node reached with the words, None if no literal starts with the words
+        """
+        node = self.__root
+        for word in words:
+            node = node.getChild(word)
+            if node is None:
+                return None
+        return node
+
+    def isPrefix(self, words: list) -> bool:
+        """
+        Checks whether some multi-word literal starts with the specified words.
+
+        PARAMETERS
+        ----------
+        words : list
+            Words to be checked
+
+        RETURNS
+        -------
+        bool
+            True if a literal starts with the words, false otherwise
+        """
+        return self.getNode(words) is not None
+
+    def size(self) -> int:
+        """
+        Returns the number of literals in the trie.
+
+        RETURNS
+        -------
+        int
+            Number of multi-word literals
+        """
+        return self.__size
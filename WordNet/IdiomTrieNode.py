@@ -0,0 +1,72 @@
+from __future__ import annotations
+
+
+class IdiomTrieNode:
+
+    __children: dict
+    __literal: str
+
+    def __init__(self):
+        """
+        Creates a node without children that does not end any literal.
+        """
+        self.__children = {}
+        self.__literal = None
+
+    def addChild(self, word: str) -> IdiomTrieNode:
+        """
+        Returns the child reached with the specified word, creating it if it does not exist.
+
+        PARAMETERS
+        ----------
+        word : str
+            Word leading to the child
+
+        RETURNS
+        -------
+        IdiomTrieNode
+            Child reached with the word
+        """
+        child = self.__children.get(word)
+        if child is None:
+            child = IdiomTrieNode()
+            self.__children[word] = child
+        return child
+
+    def getChild(self, word: str) -> IdiomTrieNode:
+        """
+        Returns the child reached with the specified word.
+
+        PARAMETERS
+        ----------
+        word : str
+            Word leading to the child
+
+        RETURNS
+        -------
+        IdiomTrieNode
+            Child reached with the word, None if no literal continues with the word
+        """
+        return self.__children.get(word)
+
+    def setLiteral(self, literal: str):
+        """
+        Marks the node as the end of the specified literal.
+
+        PARAMETERS
+        ----------
+        literal : str
+            Literal name spelled by the words from the root to this node
+        """
+        self.__literal = literal
+
+    def getLiteral(self) -> str:
+        """
+        Accessor for the literal ending at this node.
+
+        RETURNS
+        -------
+        str
+            Literal name spelled by the words from the root to this node, None if no literal ends here
+        """
+        return self.__literal
@@ -0,0 +1,438 @@
+from __future__ import annotations
+
+import struct
+import sys
+from array import array
+
+from WordNet.IdMapping import IdMapping
+from WordNet.InterlingualRelation import InterlingualRelation
+from WordNet.SynSet import SynSet
+from WordNet.WordNet import WordNet
+
+
+class InterlingualIndex:
+    """
+    Links the SynSets of a WordNet to the English WordNet 3.1 SynSets of their interlingual relations, and those to the
+    Interlingual Index (ILI) concepts of ili-mapping.txt, in both directions. Every SynSet, English and ILI ID gets a
+    dense integer, and the links are kept in offset and target arrays, the targets of the i'th ID being
+    targets[offsets[i]:offsets[i + 1]]. The index is a snapshot of the WordNet at the time it is built.
+    """
+
+    MAGIC = b"KENETIL1"
+    HEADER = struct.Struct("<8sIIIII")
+
+    __syn_sets: list
+    __syn_set_ids: list
+    __english_ids: list
+    __ili_ids: list
+    __syn_set_indices: dict
+    __english_indices: dict
+    __ili_indices: dict
+    __syn_set_english_offsets: array
+    __syn_set_english: array
+    __english_syn_set_offsets: array
+    __english_syn_sets: array
+    __english_ili: array
+    __ili_english_offsets: array
+    __ili_english: array
+
+    def __init__(self,
+                 wordNet: WordNet = None,
+                 iliMapping: IdMapping = None):
+        """
+        Builds the index from the interlingual relations of the SynSets of a WordNet and a mapping from English
+        WordNet 3.1 IDs to ILI IDs. SynSets are numbered in the order of the WordNet, English IDs in the order they
+        are first seen in the relations followed by the remaining keys of the mapping in sorted order, and ILI IDs in
+        the order of their English IDs.
+
+        PARAMETERS
+        ----------
+        wordNet : WordNet
+            WordNet whose SynSets will be linked, an empty index is created if it is None
+        iliMapping : IdMapping
+            Mapping from English WordNet 3.1 IDs to ILI IDs, such as the one read from ili-mapping.txt
+        """
+        self.__syn_sets = []
+        self.__syn_set_ids = []
+        self.__english_ids = []
+        self.__ili_ids = []
+        self.__english_indices = {}
+        self.__ili_indices = {}
+        links = []
+        if wordNet is not None:
+            for syn_set in wordNet.synSetList():
+                syn_set_index = len(self.__syn_sets)
+                self.__syn_sets.append(syn_set)
+                self.__syn_set_ids.append(syn_set.getId())
+                for i in range(syn_set.relationSize()):
+                    relation = syn_set.getRelation(i)
+                    if isinstance(relation, InterlingualRelation):
+                        links.append((syn_set_index, self.__addId(relation.getName(), self.__english_ids,
+                                                                  self.__english_indices)))
+        self.__syn_set_indices = {syn_set_id: index for index, syn_set_id in enumerate(self.__syn_set_ids)}
+        english_ili = array("i")
+        if iliMapping is not None:
+            for english_id in sorted(iliMapping.keySet()):
+                self.__addId(english_id, self.__english_ids, self.__english_indices)
+            for english_id in self.__english_ids:
+                ili_id = iliMapping.map(english_id)
+                if ili_id is None:
+                    english_ili.append(-1)
+                else:
+                    english_ili.append(self.__addId(ili_id, self.__ili_ids, self.__ili_indices))
+        else:
+            english_ili.extend([-1] * len(self.__english_ids))
+        self.__english_ili = english_ili
+        self.__syn_set_english_offsets, self.__syn_set_english = \
+            InterlingualIndex.__compress(links, len(self.__syn_set_ids))
+        self.__english_syn_set_offsets, self.__english_syn_sets = \
+            InterlingualIndex.__compress([(english, syn_set) for syn_set, english in links], len(self.__english_ids))
+        self.__ili_english_offsets, self.__ili_english = \
+            InterlingualIndex.__compress([(ili, english) for english, ili in enumerate(english_ili) if ili >= 0],
+                                         len(self.__ili_ids))
+
+    @staticmethod
+    def __addId(_id: str,
+                ids: list,
+                indices: dict) -> int:
+        index = indices.get(_id)
+        if index is None:
+            index = len(ids)
+            indices[_id] = index
+            ids.append(_id)
+        return index
+
+    @staticmethod
+    def __compress(pairs: list, size: int) -> tuple:
+        """
+        Stores (source, target) pairs of dense IDs as an offset array and a target array, keeping the order of the
+        pairs within a source.
+        """
+        offsets = array("I", [0]) * (size + 1)
+        for source, target in pairs:
+            offsets[source + 1] += 1
+        for i in range(size):
+            offsets[i + 1] += offsets[i]
+        targets = array("I", [0]) * len(pairs)
+        positions = offsets[:size]
+        for source, target in pairs:
+            targets[positions[source]] = target
+            positions[source] += 1
+        return offsets, targets
+
+    @staticmethod
+    def load(fileName: str, wordNet: WordNet) -> InterlingualIndex:
+        """
+        Reads an index written by save. The SynSet IDs in the file are resolved against the specified WordNet, IDs
+        that it does not contain stay in the index without a SynSet.
+
+        PARAMETERS
+        ----------
+        fileName : str
+            Binary file to be read
+        wordNet : WordNet
+            WordNet whose SynSets the index links
+
+        RETURNS
+        -------
+        InterlingualIndex
+            Index stored in the file
+
+        RAISES
+        ------
+        ValueError
+            If the file is not an interlingual index file
+        """
+        with open(fileName, "rb") as input_file:
+            data = input_file.read()
+        magic, syn_set_count, english_count, ili_count, link_count, string_length = \
+            InterlingualIndex.HEADER.unpack_from(data, 0)
+        if magic != InterlingualIndex.MAGIC:
+            raise ValueError(fileName + " is not an interlingual index file")
+        position = InterlingualIndex.HEADER.size
+        strings = data[position: position + string_length].decode("utf8").split("\n")
+        position += string_length
+        index = InterlingualIndex()
+        index.__syn_set_ids = strings[:syn_set_count]
+        index.__english_ids = strings[syn_set_count: syn_set_count + english_count]
+        index.__ili_ids = strings[syn_set_count + english_count: syn_set_count + english_count + ili_count]
+        index.__syn_set_indices = {syn_set_id: i for i, syn_set_id in enumerate(index.__syn_set_ids)}
+        index.__english_indices = {english_id: i for i, english_id in enumerate(index.__english_ids)}
+        index.__ili_indices = {ili_id: i for i, ili_id in enumerate(index.__ili_ids)}
+        index.__syn_sets = [wordNet.getSynSetWithId(syn_set_id) for syn_set_id in index.__syn_set_ids]
+        index.__syn_set_english_offsets, position = InterlingualIndex.__readArray(data, position, "I",
+                                                                                  syn_set_count + 1)
+        index.__syn_set_english, position = InterlingualIndex.__readArray(data, position, "I", link_count)
+        index.__english_syn_set_offsets, position = InterlingualIndex.__readArray(data, position, "I",
+                                                                                  english_count + 1)
+        index.__english_syn_sets, position = InterlingualIndex.__readArray(data, position, "I", link_count)
+        index.__english_ili, position = InterlingualIndex.__readArray(data, position, "i", english_count)
+        index.__ili_english_offsets, position = InterlingualIndex.__readArray(data, position, "I", ili_count + 1)
+        index.__ili_english, position = InterlingualIndex.__readArray(data, position, "I",
+                                                                      index.__ili_english_offsets[ili_count])
+        return index
+
+    @staticmethod
+    def __readArray(data: bytes,
+                    position: int,
+                    typeCode: str,
+                    size: int) -> tuple:
+        values = array(typeCode)
+        end = position + size * values.itemsize
+        values.frombytes(data[position: end])
+        if sys.byteorder != "little":
+            values.byteswap()
+        return values, end
+
+    def save(self, fileName: str):
+        """
+        Saves the index to a binary file read by load. The file holds the IDs once as strings and every link as a
+        four byte integer.
+
+        PARAMETERS
+        ----------
+        fileName : str
+            Binary file to write the index
+        """
+        strings = "\n".join(self.__syn_set_ids + self.__english_ids + self.__ili_ids).encode("utf8")
+        with open(fileName, "wb") as output_file:
+            output_file.write(InterlingualIndex.HEADER.pack(InterlingualIndex.MAGIC, len(self.__syn_set_ids),
+                                                            len(self.__english_ids), len(self.__ili_ids),
+                                                            len(self.__syn_set_english), len(strings)))
+            output_file.write(strings)
+            for values in (self.__syn_set_english_offsets, self.__syn_set_english, self.__english_syn_set_offsets,
+                           self.__english_syn_sets, self.__english_ili, self.__ili_english_offsets, self.__ili_english):
+                if sys.byteorder != "little":
+                    values = array(values.typecode, values)
+                    values.byteswap()
+                output_file.write(values.tobytes())
+
+    def synSetSize(self) -> int:
+        """
+        Returns the number of SynSets in the index.
+
+        RETURNS
+        -------
+        int
+            Number of SynSets
+        """
+        return len(self.__syn_set_ids)
+
+    def englishSize(self) -> int:
+        """
+        Returns the number of English WordNet 3.1 IDs in the index.
+
+        RETURNS
+        -------
+        int
+            Number of English IDs
+        """
+        return len(self.__english_ids)
+
+    def iliSize(self) -> int:
+        """
+        Returns the number of ILI IDs in the index.
+
+        RETURNS
+        -------
+        int
+            Number of ILI IDs
+        """
+        return len(self.__ili_ids)
+
+    def synSetIndex(self, synSetId: str) -> int:
+        """
+        Returns the dense integer of a SynSet ID.
+
+        PARAMETERS
+        ----------
+        synSetId : str
+            SynSet ID to be searched
+
+        RETURNS
+        -------
+        int
+            Dense integer of the SynSet, -1 if it is not in the index
+        """
+        return self.__syn_set_indices.get(synSetId, -1)
+
+    def englishIndex(self, englishId: str) -> int:
+        """
+        Returns the dense integer of an English WordNet 3.1 ID.
+
+        PARAMETERS
+        ----------
+        englishId : str
+            English ID to be searched
+
+        RETURNS
+        -------
+        int
+            Dense integer of the English ID, -1 if it is not in the index
+        """
+        return self.__english_indices.get(englishId, -1)
+
+    def iliIndex(self, iliId: str) -> int:
+        """
+        Returns the dense integer of an ILI ID.
+
+        PARAMETERS
+        ----------
+        iliId : str
+            ILI ID to be searched
+
+        RETURNS
+        -------
+        int
+            Dense integer of the ILI ID, -1 if it is not in the index
+        """
+        return self.__ili_indices.get(iliId, -1)
+
+    def getEnglish(self, synSetId: str) -> list:
+        """
+        Returns the English WordNet 3.1 IDs of the interlingual relations of a SynSet.
+
+        PARAMETERS
+        ----------
+        synSetId : str
+            SynSet ID to be searched
+
+        RETURNS
+        -------
+        list
+            English IDs of the SynSet in the order of its relations
+        """
+        index = self.__syn_set_indices.get(synSetId)
+        if index is None:
+            return []
+        return [self.__english_ids[english] for english in
+                self.__syn_set_english[self.__syn_set_english_offsets[index]:
+                                       self.__syn_set_english_offsets[index + 1]]]
+
+    def getIli(self, synSetId: str) -> list:
+        """
+        Returns the ILI IDs of a SynSet reached through its English WordNet 3.1 IDs.
+
+        PARAMETERS
+        ----------
+        synSetId : str
+            SynSet ID to be searched
+
+        RETURNS
+        -------
+        list
+            Distinct ILI IDs of the SynSet in the order of its relations
+        """
+        index = self.__syn_set_indices.get(synSetId)
+        if index is None:
+            return []
+        result = []
+        for english in self.__syn_set_english[self.__syn_set_english_offsets[index]:
+                                              self.__syn_set_english_offsets[index + 1]]:
+            ili = self.__english_ili[english]
+            if ili >= 0 and self.__ili_ids[ili] not in result:
+                result.append(self.__ili_ids[ili])
+        return result
+
+    def getEnglishOfIli(self, iliId: str) -> list:
+        """
+        Returns the English WordNet 3.1 IDs mapped to an ILI ID.
+
+        PARAMETERS
+        ----------
+        iliId : str
+            ILI ID to be searched
+
+        RETURNS
+        -------
+        list
+            English IDs of the ILI ID
+        """
+        index = self.__ili_indices.get(iliId)
+        if index is None:
+            return []
+        return [self.__english_ids[english] for english in
+                self.__ili_english[self.__ili_english_offsets[index]: self.__ili_english_offsets[index + 1]]]
+
+    def __synSetIndicesOf(self, interlingualId: str) -> list:
+        english = self.__english_indices.get(interlingualId)
+        if english is not None:
+            return self.__english_syn_sets[self.__english_syn_set_offsets[english]:
+                                           self.__english_syn_set_offsets[english + 1]].tolist()
+        ili = self.__ili_indices.get(interlingualId)
+        if ili is None:
+            return []
+        result = []
+        for english in self.__ili_english[self.__ili_english_offsets[ili]: self.__ili_english_offsets[ili + 1]]:
+            result.extend(self.__english_syn_sets[self.__english_syn_set_offsets[english]:
+                                                  self.__english_syn_set_offsets[english + 1]])
+        return result
+
+    def getSynSetIds(self, interlingualId: str) -> list:
+        """
+        Returns the IDs of the SynSets linked to an English WordNet 3.1 ID or to an ILI ID.
+
+        PARAMETERS
+        ----------
+        interlingualId : str
+            English or ILI ID to be searched
+
+        RETURNS
+        -------
+        list
+            IDs of the SynSets with an interlingual relation to the ID
+        """
+        return [self.__syn_set_ids[index] for index in self.__synSetIndicesOf(interlingualId)]
+
+    def getInterlingual(self, interlingualId: str) -> list:
+        """
+        Returns the SynSets linked to an English WordNet 3.1 ID or to an ILI ID.
+
+        PARAMETERS
+        ----------
+        interlingualId : str
+            English or ILI ID to be searched
+
+        RETURNS
+        -------
+        list
+            SynSets with an interlingual relation to the ID
+        """
+        result = []
+        for index in self.__synSetIndicesOf(interlingualId):
+            syn_set = self.__syn_sets[index]
+            if syn_set is not None:
+                result.append(syn_set)
+        return result
+
+    def getInterlingualBatch(self, ids) -> list:
+        """
+        Returns the SynSets linked to each of the specified English WordNet 3.1 or ILI IDs.
+
+        PARAMETERS
+        ----------
+        ids
+            Iterable of English or ILI IDs
+
+        RETURNS
+        -------
+        list
+            List of the SynSets of every ID, in the order of the IDs
+        """
+        return [self.getInterlingual(interlingual_id) for interlingual_id in ids]
+
+    def getSynSet(self, index: int) -> SynSet:
+        """
+        Returns the SynSet with the specified dense integer.
+
+        PARAMETERS
+        ----------
+        index : int
+            Dense integer of the SynSet
+
+        RETURNS
+        -------
+        SynSet
+            SynSet with the integer, None if the WordNet the index was loaded with does not contain it
+        """
+        return self.__syn_sets[index]
@@ -3,6 +3,9 @@ from WordNet.Relation import Relation
 
 
 class InterlingualRelation(Relation):
+
+    __slots__ = ("__dependency_type",)
+
     __dependency_type: InterlingualDependencyType
 
     interlingual_dependency = ["Hypernym", "Near_antonym", "Holo_member", "Holo_part", "Holo_portion",
@@ -20,6 +23,8 @@ class InterlingualRelation(Relation):
                                     InterlingualDependencyType.CAUSES,
                                     InterlingualDependencyType.SYNONYM]
 
+    interlingual_tag_map = dict(zip(interlingual_dependency, interlingual_dependency_tags))
+
     @staticmethod
     def getInterlingualDependencyTag(tag: str) -> InterlingualDependencyType:
         """
@@ -36,10 +41,7 @@ class InterlingualRelation(Relation):
         InterlingualDependencyType
             Interlingual dependency type according to specified tag
         """
-        for i in range(len(InterlingualRelation.interlingual_dependency)):
-            if tag == InterlingualRelation.interlingual_dependency[i]:
-                return InterlingualRelation.interlingual_dependency_tags[i]
-        return None
+        return InterlingualRelation.interlingual_tag_map.get(tag)
 
     def __init__(self,
                  name: str,
@@ -6,6 +6,8 @@ from WordNet.SemanticRelationType import SemanticRelationType
 
 class Literal:
 
+    __slots__ = ("name", "sense", "syn_set_id", "origin", "relations", "group_no")
+
     name: str
     sense: int
     syn_set_id: str
@@ -18,7 +20,8 @@ class Literal:
                  sense: int,
                  synSetId: str):
         """
-        A constructor that initializes name, sense, SynSet ID and the relations.
+        A constructor that initializes name, sense, SynSet ID and the relations. Most literals have no relations, so
+        the relations start as the shared empty tuple and a list is created only when the first relation is added.
 
         PARAMETERS
         ----------
@@ -32,7 +35,7 @@ class Literal:
         self.name = name
         self.sense = sense
         self.syn_set_id = synSetId
-        self.relations = []
+        self.relations = ()
         self.origin = None
         self.group_no = 0
 
@@ -149,6 +152,8 @@ class Literal:
         relation : Relation
             Element to be appended to the list
         """
+        if isinstance(self.relations, tuple):
+            self.relations = list(self.relations)
         self.relations.append(relation)
 
     def removeRelation(self, relation: Relation):
@@ -161,6 +166,8 @@ class Literal:
         relation : Relation
             Element to be removed from the list, if present
         """
+        if isinstance(self.relations, tuple):
+            self.relations = list(self.relations)
         self.relations.remove(relation)
 
     def containsRelation(self, relation: Relation) -> bool:
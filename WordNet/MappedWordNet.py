@@ -0,0 +1,509 @@
+from Dictionary.Pos import Pos
+
+from WordNet.IdMapping import IdMapping
+from WordNet.Literal import Literal
+from WordNet.SemanticRelation import SemanticRelation
+from WordNet.SynSet import SynSet
+from WordNet.WordNet import WordNet
+from WordNet.WordNetSnapshot import WordNetSnapshot
+
+
+class MappedWordNet(WordNet):
+    """
+    Read-only WordNet backed by a memory-mapped snapshot file written by WordNet.saveSnapshot. No SynSet or literal is
+    kept in memory; every query binary searches the index sections of the mapped file and decodes only the records it
+    needs, so all processes mapping the same snapshot share one physical copy of the data. Objects returned by the
+    queries are decoded anew on every call, modifying them does not change the snapshot.
+    """
+
+    __snapshot: WordNetSnapshot
+    __exception_list: dict
+    __incoming: dict
+
+    def __init__(self,
+                 fileName: str,
+                 sourceFileName: str = None):
+        """
+        Maps a snapshot file into memory. If the source XML file is given, the snapshot is accepted only if it was
+        created from the current contents of that file.
+
+        PARAMETERS
+        ----------
+        fileName : str
+            Snapshot file to be mapped
+        sourceFileName : str
+            XML file the snapshot is expected to be created from
+        """
+        self.__snapshot = WordNetSnapshot(fileName)
+        self.__exception_list = None
+        self.__incoming = None
+        if sourceFileName is not None and WordNetSnapshot.fileChecksum(sourceFileName) != self.__snapshot.getChecksum():
+            self.__snapshot.close()
+            raise ValueError("Snapshot " + fileName + " is stale for " + sourceFileName)
+
+    def close(self):
+        """
+        Releases the memory map of the snapshot file.
+        """
+        self.__snapshot.close()
+
+    def __readOnly(self):
+        raise TypeError("MappedWordNet is read-only")
+
+    def __synSetRecord(self, synSetId: str) -> tuple:
+        positions = self.__snapshot.findRange(WordNetSnapshot.SYN_SET_INDEX, WordNetSnapshot.SYN_SETS,
+                                              WordNetSnapshot.SYN_SET, synSetId)
+        if len(positions) == 0:
+            return None
+        index = self.__snapshot.record(WordNetSnapshot.SYN_SET_INDEX, WordNetSnapshot.OFFSET, positions[0])[0]
+        return self.__snapshot.record(WordNetSnapshot.SYN_SETS, WordNetSnapshot.SYN_SET, index)
+
+    def __literalRecords(self, literal: str) -> list:
+        positions = self.__snapshot.findRange(WordNetSnapshot.LITERAL_INDEX, WordNetSnapshot.LITERALS,
+                                              WordNetSnapshot.LITERAL, literal)
+        result = []
+        for position in positions:
+            index = self.__snapshot.record(WordNetSnapshot.LITERAL_INDEX, WordNetSnapshot.OFFSET, position)[0]
+            result.append(self.__snapshot.record(WordNetSnapshot.LITERALS, WordNetSnapshot.LITERAL, index))
+        return result
+
+    def readExceptionFile(self, exceptionFileName: str):
+        self.__readOnly()
+
+    def __exceptionList(self) -> dict:
+        if self.__exception_list is None:
+            self.__exception_list = {}
+            for exception_record in self.__snapshot.records(WordNetSnapshot.EXCEPTIONS, WordNetSnapshot.EXCEPTION):
+                exceptional_word = self.__snapshot.createExceptionalWord(exception_record)
+                if exceptional_word.getName() not in self.__exception_list:
+                    self.__exception_list[exceptional_word.getName()] = []
+                self.__exception_list[exceptional_word.getName()].append(exceptional_word)
+        return self.__exception_list
+
+    def getExceptionalWords(self, word: str) -> list:
+        """
+        Returns the exceptional words stored in the snapshot for a specified word form. The exception list is small,
+        it is decoded once on the first call.
+
+        PARAMETERS
+        ----------
+        word : str
+            Word form to be searched in the exception list
+
+        RETURNS
+        -------
+        list
+            A list of ExceptionalWords whose name is the specified word form
+        """
+        exception_list = self.__exceptionList()
+        if word in exception_list:
+            return exception_list[word]
+        else:
+            return []
+
+    def exceptionList(self) -> list:
+        """
+        Returns the word forms having exceptional words in the snapshot.
+
+        RETURNS
+        -------
+        list
+            Word forms of the exception list
+        """
+        return list(self.__exceptionList().keys())
+
+    def addLiteralToLiteralList(self, literal: Literal):
+        self.__readOnly()
+
+    def synSetList(self) -> list:
+        """
+        Decodes all SynSets of the snapshot.
+
+        RETURNS
+        -------
+        list
+            SynSets in the order they were saved
+        """
+        result = []
+        for syn_set_record in self.__snapshot.records(WordNetSnapshot.SYN_SETS, WordNetSnapshot.SYN_SET):
+            result.append(self.__snapshot.createSynSet(syn_set_record))
+        return result
+
+    def literalList(self) -> list:
+        """
+        Returns the distinct literal names of the snapshot.
+
+        RETURNS
+        -------
+        list
+            Literal names in the order they were saved
+        """
+        names = {}
+        for literal_index, in self.__snapshot.records(WordNetSnapshot.LITERAL_LIST, WordNetSnapshot.OFFSET):
+            names[self.__snapshot.record(WordNetSnapshot.LITERALS, WordNetSnapshot.LITERAL, literal_index)[0]] = True
+        return [self.__snapshot.string(name) for name in names]
+
+    def addSynSet(self, synSet: SynSet):
+        self.__readOnly()
+
+    def removeSynSet(self, synSet: SynSet):
+        self.__readOnly()
+
+    def changeSynSetId(self,
+                       synSet: SynSet,
+                       newId: str):
+        self.__readOnly()
+
+    def applyIdMapping(self, idMapping: IdMapping) -> dict:
+        self.__readOnly()
+
+    def getSynSetWithId(self, synSetId: str) -> SynSet:
+        """
+        Decodes the SynSet with the specified SynSet ID.
+
+        PARAMETERS
+        ----------
+        synSetId : str
+            ID of the SynSet to be returned
+
+        RETURNS
+        -------
+        SynSet
+            SynSet with the specified SynSet ID
+        """
+        syn_set_record = self.__synSetRecord(synSetId)
+        if syn_set_record is None:
+            return None
+        return self.__snapshot.createSynSet(syn_set_record)
+
+    def getSynSetWithLiteral(self,
+                             literal: str,
+                             sense: int) -> SynSet:
+        """
+        Decodes the SynSet with the specified literal and sense index.
+
+        PARAMETERS
+        ----------
+        literal : str
+            SynSet literal
+        sense : int
+            SynSet's corresponding sense index
+
+        RETURNS
+        -------
+        SynSet
+            SynSet with the specified literal and sense index
+        """
+        for literal_record in self.__literalRecords(literal):
+            if literal_record[1] == sense:
+                return self.getSynSetWithId(self.__snapshot.string(literal_record[2]))
+        return None
+
+    def getPlaceholderSynSet(self, literal: str) -> SynSet:
+        """
+        Decodes the first sense of a placeholder literal, such as "(özel isim)" or "(tarih)".
+
+        PARAMETERS
+        ----------
+        literal : str
+            Placeholder literal
+
+        RETURNS
+        -------
+        SynSet
+            SynSet of the first sense of the placeholder literal
+        """
+        return self.getSynSetWithLiteral(literal, 1)
+
+    def numberOfSynSetsWithLiteral(self, literal: str) -> int:
+        """
+        Returns the number of SynSets with a specified literal.
+
+        PARAMETERS
+        ----------
+        literal : str
+            literal to be searched in SynSets
+
+        RETURNS
+        -------
+        int
+            The number of SynSets with a specified literal
+        """
+        return len(self.__snapshot.findRange(WordNetSnapshot.LITERAL_INDEX, WordNetSnapshot.LITERALS,
+                                             WordNetSnapshot.LITERAL, literal))
+
+    def getSynSetsWithPartOfSpeech(self, pos: Pos) -> list:
+        """
+        Decodes the SynSets with a specified part of speech tag.
+
+        PARAMETERS
+        ----------
+        pos : Pos
+            Part of speech tag to be searched in SynSets
+
+        RETURNS
+        -------
+        list
+            A list of SynSets with a specified part of speech tag
+        """
+        result = []
+        if pos is None:
+            return result
+        for syn_set_record in self.__snapshot.records(WordNetSnapshot.SYN_SETS, WordNetSnapshot.SYN_SET):
+            if syn_set_record[1] == pos.value:
+                result.append(self.__snapshot.createSynSet(syn_set_record))
+        return result
+
+    def getLiteralsWithName(self, literal: str) -> list:
+        """
+        Decodes the literals with a specified literal String.
+
+        PARAMETERS
+        ----------
+        literal : str
+            literal String to be searched in literal list
+
+        RETURNS
+        -------
+        list
+            A list of literals with a specified literal String
+        """
+        result = []
+        for literal_record in self.__literalRecords(literal):
+            result.append(self.__snapshot.createLiteral(literal_record))
+        return result
+
+    def getSynSetsWithLiteralAndPos(self,
+                                    literal: str,
+                                    pos: Pos):
+        """
+        Generates the SynSets with specified literal String and part of speech tag, decoding them one by one.
+
+        PARAMETERS
+        ----------
+        literal : str
+            literal String to be searched in literal list
+        pos : Pos
+            part of speech tag to be searched in SynSets
+
+        RETURNS
+        -------
+        generator
+            SynSets with specified literal String and part of speech tag
+        """
+        for literal_record in self.__literalRecords(literal):
+            syn_set_record = self.__synSetRecord(self.__snapshot.string(literal_record[2]))
+            if syn_set_record is not None and WordNetSnapshot.POS_TAGS[syn_set_record[1]] == pos:
+                yield self.__snapshot.createSynSet(syn_set_record)
+
+    def getSynSetsWithLiteral(self, literal: str) -> list:
+        """
+        Decodes the SynSets with specified literal String.
+
+        PARAMETERS
+        ----------
+        literal : str
+            literal String to be searched in literal list
+
+        RETURNS
+        -------
+        list
+            Returns a list of SynSets with specified literal String
+        """
+        result = []
+        for literal_record in self.__literalRecords(literal):
+            syn_set = self.getSynSetWithId(self.__snapshot.string(literal_record[2]))
+            if syn_set is not None:
+                result.append(syn_set)
+        return result
+
+    def addReverseRelation(self,
+                           synSet: SynSet,
+                           semanticRelation: SemanticRelation):
+        self.__readOnly()
+
+    def removeReverseRelation(self,
+                              synSet: SynSet,
+                              semanticRelation: SemanticRelation):
+        self.__readOnly()
+
+    def equalizeSemanticRelations(self):
+        self.__readOnly()
+
+    def sortDefinitions(self):
+        self.__readOnly()
+
+    def getInterlingual(self, synSetId: str) -> list:
+        """
+        Decodes the SynSets with the interlingual relations of a specified SynSet ID.
+
+        PARAMETERS
+        ----------
+        synSetId : str
+            SynSet ID to be searched
+
+        RETURNS
+        -------
+        list
+            A list of SynSets with the interlingual relations of a specified SynSet ID
+        """
+        result = []
+        for position in self.__snapshot.findRange(WordNetSnapshot.INTERLINGUAL_INDEX, WordNetSnapshot.INTERLINGUALS,
+                                                  WordNetSnapshot.INTERLINGUAL, synSetId):
+            index = self.__snapshot.record(WordNetSnapshot.INTERLINGUAL_INDEX, WordNetSnapshot.OFFSET, position)[0]
+            syn_set_index = self.__snapshot.record(WordNetSnapshot.INTERLINGUALS, WordNetSnapshot.INTERLINGUAL,
+                                                   index)[1]
+            result.append(self.__snapshot.createSynSet(self.__snapshot.record(WordNetSnapshot.SYN_SETS,
+                                                                              WordNetSnapshot.SYN_SET, syn_set_index)))
+        return result
+
+    def incoming(self,
+                 synSetId: str,
+                 types=None):
+        """
+        Generates the semantic relations pointing at a SynSet. The IDs of the SynSets having relations to each target
+        are collected with one pass over the snapshot on the first call; the SynSets themselves are decoded anew.
+
+        PARAMETERS
+        ----------
+        synSetId : str
+            ID of the target SynSet
+        types
+            Iterable of SemanticRelationTypes to be generated, all types if None
+
+        RETURNS
+        -------
+        generator
+            A (SynSet, SemanticRelation) tuple for every relation pointing at the SynSet, the SynSet being the one
+            having the relation
+        """
+        if self.__incoming is None:
+            self.__incoming = {}
+            for syn_set in self.synSetList():
+                for i in range(syn_set.relationSize()):
+                    relation = syn_set.getRelation(i)
+                    if isinstance(relation, SemanticRelation):
+                        if relation.getName() not in self.__incoming:
+                            self.__incoming[relation.getName()] = {}
+                        by_type = self.__incoming[relation.getName()]
+                        if relation.getRelationType() not in by_type:
+                            by_type[relation.getRelationType()] = []
+                        by_type[relation.getRelationType()].append((syn_set.getId(), i))
+        by_type = self.__incoming.get(synSetId, {})
+        if types is None:
+            types = list(by_type.keys())
+        for relation_type in types:
+            for source_id, index in by_type.get(relation_type, []):
+                source = self.getSynSetWithId(source_id)
+                yield source, source.getRelation(index)
+
+    def pathToRoot(self, synSet: SynSet) -> tuple:
+        """
+        Finds the path to the root of a SynSet by percolating up through the decoded hypernyms.
+
+        PARAMETERS
+        ----------
+        synSet : SynSet
+            SynSet whose root path will be found
+
+        RETURNS
+        -------
+        tuple
+            IDs of the SynSets in the path
+        """
+        return self.percolatePathToRoot(synSet)
+
+    def ancestors(self, synSet: SynSet) -> dict:
+        """
+        Maps the IDs on the path from a SynSet to the root to their positions in the path.
+
+        PARAMETERS
+        ----------
+        synSet : SynSet
+            SynSet whose ancestors will be found
+
+        RETURNS
+        -------
+        dict
+            Position of every ID in the path to the root, 0 for the SynSet itself
+        """
+        return {syn_set_id: position for position, syn_set_id in enumerate(self.pathToRoot(synSet))}
+
+    def isA(self,
+            synSet: SynSet,
+            ancestor: SynSet) -> bool:
+        """
+        Checks whether the other SynSet is on the path from a SynSet to the root, percolating up through the decoded
+        hypernyms.
+
+        PARAMETERS
+        ----------
+        synSet : SynSet
+            SynSet to be checked
+        ancestor : SynSet
+            Possible ancestor
+
+        RETURNS
+        -------
+        bool
+            True if the ancestor is on the path from the SynSet to the root, False otherwise
+        """
+        return ancestor.getId() in self.pathToRoot(synSet)
+
+    def filterByAncestor(self,
+                         candidates: list,
+                         ancestor: SynSet) -> list:
+        """
+        Selects the candidates that are a kind of the specified ancestor, keeping their order.
+
+        PARAMETERS
+        ----------
+        candidates : list
+            SynSets to be filtered
+        ancestor : SynSet
+            SynSet the selected candidates descend from
+
+        RETURNS
+        -------
+        list
+            Candidates having the ancestor on their path to the root
+        """
+        return [candidate for candidate in candidates if self.isA(candidate, ancestor)]
+
+    def saveAsXml(self, fileName: str):
+        """
+        Method to write SynSets to the specified file in the XML format.
+
+        PARAMETERS
+        ----------
+        fileName : str
+            file name to write XML files
+        """
+        out_file = open(fileName, "w", encoding="utf8")
+        out_file.write("<SYNSETS>\n")
+        for syn_set_record in self.__snapshot.records(WordNetSnapshot.SYN_SETS, WordNetSnapshot.SYN_SET):
+            self.__snapshot.createSynSet(syn_set_record).saveAsXml(out_file)
+        out_file.write("</SYNSETS>\n")
+        out_file.close()
+
+    def saveSnapshot(self, fileName: str):
+        """
+        Writes a copy of the mapped snapshot.
+
+        PARAMETERS
+        ----------
+        fileName : str
+            Snapshot file to be written
+        """
+        self.__snapshot.saveAs(fileName)
+
+    def size(self) -> int:
+        """
+        Returns the number of SynSets in the snapshot.
+
+        RETURNS
+        -------
+        int
+            The number of SynSets
+        """
+        return self.__snapshot.count(WordNetSnapshot.SYN_SETS)
@@ -0,0 +1,94 @@
+from MorphologicalAnalysis.FsmMorphologicalAnalyzer import FsmMorphologicalAnalyzer
+
+from WordNet.WordNet import WordNet
+
+
+class MultiWordExpressionDetector:
+    """
+    Finds the multi-word literals of a WordNet, such as idioms and compounds of any length, in a sentence. The sentence
+    is given as a lattice holding the candidate forms of every token, and is scanned once from left to right over the
+    word level prefix tree of the literals. Every token advances the partial matches that are still alive and starts a
+    new one, so the work per token depends on the number of live matches and candidates, not on the size of the
+    lexicon.
+    """
+
+    __word_net: WordNet
+
+    def __init__(self, wordNet: WordNet):
+        """
+        Creates a detector for the multi-word literals of a WordNet.
+
+        PARAMETERS
+        ----------
+        wordNet : WordNet
+            WordNet whose literals will be detected
+        """
+        self.__word_net = wordNet
+
+    def detect(self, lattice: list) -> list:
+        """
+        Finds all multi-word literals spelled by one candidate of each of some consecutive tokens. Overlapping and
+        nested matches are all returned.
+
+        PARAMETERS
+        ----------
+        lattice : list
+            Candidate forms of every token of the sentence, each an iterable of strings
+
+        RETURNS
+        -------
+        list
+            A (start, end, literal, SynSets) tuple for every match, where start and end delimit the tokens of the
+            match, ordered by end and then by start
+        """
+        root = self.__word_net.getIdiomTrie().getRoot()
+        result = []
+        active = []
+        for end in range(len(lattice)):
+            candidates = set(lattice[end])
+            next_active = []
+            matches = []
+            for start, node in active + [(end, root)]:
+                for candidate in candidates:
+                    child = node.getChild(candidate)
+                    if child is not None:
+                        next_active.append((start, child))
+                        if child.getLiteral() is not None:
+                            matches.append((start, child.getLiteral()))
+            for start, literal in sorted(matches):
+                result.append((start, end + 1, literal, self.__word_net.getSynSetsWithLiteral(literal)))
+            active = next_active
+        return result
+
+    def detectInSentence(self,
+                         words: list,
+                         morphologicalParses: list,
+                         metaParses: list,
+                         fsm: FsmMorphologicalAnalyzer) -> list:
+        """
+        Finds all multi-word literals of a parsed sentence. The candidates of a token are its surface form and the
+        possible words generated from its morphological and metamorphic parses, so both inflected and lemmatized
+        forms of an idiom are found.
+
+        PARAMETERS
+        ----------
+        words : list
+            surface forms of the words of the sentence
+        morphologicalParses : list
+            morphological parses of the words
+        metaParses : list
+            metamorphic parses of the words
+        fsm : FsmMorphologicalAnalyzer
+            finite state machine morphological analyzer to be used at getting possible words
+
+        RETURNS
+        -------
+        list
+            A (start, end, literal, SynSets) tuple for every match, ordered by end and then by start
+        """
+        lattice = []
+        for word, parse, meta_parse in zip(words, morphologicalParses, metaParses):
+            candidates = set(fsm.getPossibleWords(parse, meta_parse))
+            candidates.add(word)
+            lattice.append(candidates)
+        return self.detect(lattice)
@@ -1,5 +1,7 @@
 class Relation:
 
+    __slots__ = ("name",)
+
     name: str
 
     def __init__(self, name: str):
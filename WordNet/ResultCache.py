@@ -0,0 +1,146 @@
+from collections import OrderedDict
+
+
+class ResultCache:
+    """
+    Size-bounded least recently used cache that counts its hits, misses and evictions.
+    """
+
+    __cache_size: int
+    __map: OrderedDict
+    __hits: int
+    __misses: int
+    __evictions: int
+
+    def __init__(self, cacheSize: int):
+        """
+        Creates an empty cache holding at most the specified number of results.
+
+        PARAMETERS
+        ----------
+        cacheSize : int
+            Maximum number of cached results
+        """
+        if cacheSize < 1:
+            raise ValueError("Cache size must be positive")
+        self.__cache_size = cacheSize
+        self.__map = OrderedDict()
+        self.__hits = 0
+        self.__misses = 0
+        self.__evictions = 0
+
+    def get(self, key: object) -> object:
+        """
+        Returns the result cached with the specified key and marks it as the most recently used one.
+
+        PARAMETERS
+        ----------
+        key : object
+            Key of the result
+
+        RETURNS
+        -------
+        object
+            Cached result, None if the key is not in the cache
+        """
+        if key in self.__map:
+            self.__hits = self.__hits + 1
+            self.__map.move_to_end(key)
+            return self.__map[key]
+        self.__misses = self.__misses + 1
+        return None
+
+    def add(self,
+            key: object,
+            data: object):
+        """
+        Caches a result with the specified key. If the cache is full, the least recently used result is evicted.
+
+        PARAMETERS
+        ----------
+        key : object
+            Key of the result
+        data : object
+            Result to be cached
+        """
+        if key in self.__map:
+            self.__map.move_to_end(key)
+        elif len(self.__map) == self.__cache_size:
+            self.__map.popitem(last=False)
+            self.__evictions = self.__evictions + 1
+        self.__map[key] = data
+
+    def clear(self):
+        """
+        Removes all cached results. The counters are kept.
+        """
+        self.__map.clear()
+
+    def size(self) -> int:
+        """
+        Returns the number of cached results.
+
+        RETURNS
+        -------
+        int
+            Number of cached results
+        """
+        return len(self.__map)
+
+    def getCacheSize(self) -> int:
+        """
+        Accessor for the maximum number of cached results.
+
+        RETURNS
+        -------
+        int
+            Maximum number of cached results
+        """
+        return self.__cache_size
+
+    def getHits(self) -> int:
+        """
+        Accessor for the number of lookups that found a cached result.
+
+        RETURNS
+        -------
+        int
+            Number of hits
+        """
+        return self.__hits
+
+    def getMisses(self) -> int:
+        """
+        Accessor for the number of lookups that did not find a cached result.
+
+        RETURNS
+        -------
+        int
+            Number of misses
+        """
+        return self.__misses
+
+    def getEvictions(self) -> int:
+        """
+        Accessor for the number of results evicted to make room for new ones.
+
+        RETURNS
+        -------
+        int
+            Number of evictions
+        """
+        return self.__evictions
+
+    def getHitRate(self) -> float:
+        """
+        Returns the share of lookups that found a cached result.
+
+        RETURNS
+        -------
+        float
+            Number of hits divided by the number of lookups, 0 if there has been no lookup
+        """
+        lookups = self.__hits + self.__misses
+        if lookups == 0:
+            return 0.0
+        return self.__hits / lookups
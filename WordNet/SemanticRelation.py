@@ -3,6 +3,9 @@ from WordNet.SemanticRelationType import SemanticRelationType
 
 
 class SemanticRelation(Relation):
+
+    __slots__ = ("__relation_type", "__to_index")
+
     __relation_type: SemanticRelationType
     __to_index: int
 
@@ -28,6 +31,8 @@ class SemanticRelation(Relation):
                                 SemanticRelationType.VERB_GROUP, SemanticRelationType.SIMILAR_TO,
                                 SemanticRelationType.PARTICIPLE_OF_VERB]
 
+    semantic_tag_map = dict(zip(semantic_dependency, semantic_dependency_tags))
+
     @staticmethod
     def getSemanticTag(tag: str) -> SemanticRelationType:
         """
@@ -43,10 +48,7 @@ class SemanticRelation(Relation):
         SemanticRelationType
             Semantic relation type
         """
-        for i in range(len(SemanticRelation.semantic_dependency_tags)):
-            if tag == SemanticRelation.semantic_dependency[i]:
-                return SemanticRelation.semantic_dependency_tags[i]
-        return None
+        return SemanticRelation.semantic_tag_map.get(tag)
 
     @staticmethod
     def reverse(semanticRelationType: SemanticRelationType) -> SemanticRelationType:
@@ -0,0 +1,169 @@
+from threading import Lock
+
+from WordNet.ResultCache import ResultCache
+from WordNet.Similarity.Similarity import Similarity
+from WordNet.SynSet import SynSet
+from WordNet.WordNet import WordNet
+
+
+class CachedSimilarity(Similarity):
+    """
+    Memoizes another similarity measure. Similarities are cached with the unordered pair of SynSet IDs as the key, so
+    (a, b) and (b, a) share one entry, and the paths to the root are cached per SynSet in a second cache. Both caches
+    are least recently used caches of bounded size guarded by a lock, so one instance can be shared by the threads of
+    a process. The caches are not invalidated when the WordNet changes, clear should be called after such changes.
+    """
+
+    __similarity: Similarity
+    __cache: ResultCache
+    __path_cache: ResultCache
+    __lock: Lock
+
+    def __init__(self,
+                 similarity: Similarity,
+                 cacheSize: int = 100000,
+                 pathCacheSize: int = 10000):
+        """
+        Wraps a symmetric similarity measure, such as WuPalmer, LCH or Lin, with a similarity and a path cache.
+
+        PARAMETERS
+        ----------
+        similarity : Similarity
+            Similarity measure to be memoized
+        cacheSize : int
+            Maximum number of cached similarities
+        pathCacheSize : int
+            Maximum number of cached paths to the root
+        """
+        super().__init__(similarity.wordNet)
+        self.__similarity = similarity
+        self.__cache = ResultCache(cacheSize)
+        self.__path_cache = ResultCache(pathCacheSize)
+        self.__lock = Lock()
+
+    def __paths(self, synSet: SynSet) -> tuple:
+        """
+        Returns the path to the root of a SynSet and the positions of the IDs in the path, from the path cache if
+        possible.
+        """
+        with self.__lock:
+            paths = self.__path_cache.get(synSet.getId())
+        if paths is None:
+            path_to_root = self.wordNet.pathToRoot(synSet)
+            positions = {}
+            for position, syn_set_id in enumerate(path_to_root):
+                if syn_set_id not in positions:
+                    positions[syn_set_id] = position
+            paths = (path_to_root, positions)
+            with self.__lock:
+                self.__path_cache.add(synSet.getId(), paths)
+        return paths
+
+    def computeSimilarity(self, synSet1: SynSet, synSet2: SynSet) -> float:
+        """
+        Returns the similarity of two SynSets, computing it with the wrapped measure only if the pair is not cached.
+
+        PARAMETERS
+        ----------
+        synSet1 : SynSet
+            First SynSet
+        synSet2 : SynSet
+            Second SynSet
+
+        RETURNS
+        -------
+        float
+            Similarity of the SynSets
+        """
+        if synSet1.getId() <= synSet2.getId():
+            key = (synSet1.getId(), synSet2.getId())
+        else:
+            key = (synSet2.getId(), synSet1.getId())
+        with self.__lock:
+            similarity = self.__cache.get(key)
+        if similarity is None:
+            path_to_root1 = self.__paths(synSet1)[0]
+            path_to_root2, positions2 = self.__paths(synSet2)
+            similarity = self.__similarity.computeSimilarityFromLcs(synSet1, synSet2,
+                                                                    WordNet.findLCSWithAncestors(path_to_root1,
+                                                                                                 positions2),
+                                                                    len(path_to_root1), len(path_to_root2))
+            with self.__lock:
+                self.__cache.add(key, similarity)
+        return similarity
+
+    def computeSimilarityFromLcs(self,
+                                 synSet1: SynSet,
+                                 synSet2: SynSet,
+                                 lcs: tuple,
+                                 depth1: int,
+                                 depth2: int) -> float:
+        return self.__similarity.computeSimilarityFromLcs(synSet1, synSet2, lcs, depth1, depth2)
+
+    def upperBound(self,
+                   synSet1: SynSet,
+                   synSet2: SynSet,
+                   depth1: int,
+                   depth2: int) -> float:
+        return self.__similarity.upperBound(synSet1, synSet2, depth1, depth2)
+
+    def subtreeUpperBound(self,
+                          synSet: SynSet,
+                          lcs: tuple,
+                          depth: int,
+                          subtreeRoot: SynSet,
+                          minDepth: int,
+                          maxDepth: int) -> float:
+        return self.__similarity.subtreeUpperBound(synSet, lcs, depth, subtreeRoot, minDepth, maxDepth)
+
+    def clear(self):
+        """
+        Removes all cached similarities and paths, the counters are kept.
+        """
+        with self.__lock:
+            self.__cache.clear()
+            self.__path_cache.clear()
+
+    def getSimilarity(self) -> Similarity:
+        """
+        Accessor for the wrapped similarity measure.
+
+        RETURNS
+        -------
+        Similarity
+            Memoized similarity measure
+        """
+        return self.__similarity
+
+    def getCache(self) -> ResultCache:
+        """
+        Accessor for the cache of the similarities, whose counters give the hit rate of computeSimilarity.
+
+        RETURNS
+        -------
+        ResultCache
+            Similarity cache
+        """
+        return self.__cache
+
+    def getPathCache(self) -> ResultCache:
+        """
+        Accessor for the cache of the paths to the root.
+
+        RETURNS
+        -------
+        ResultCache
+            Path cache
+        """
+        return self.__path_cache
+
+    def getHitRate(self) -> float:
+        """
+        Returns the share of computeSimilarity calls answered from the cache.
+
+        RETURNS
+        -------
+        float
+            Hit rate of the similarity cache
+        """
+        return self.__cache.getHitRate()
@@ -0,0 +1,284 @@
+import math
+import multiprocessing
+import struct
+
+from WordNet.WordNet import WordNet
+
+
+class InformationContent:
+    """
+    Builds the information content table used by ICSimilarity, Resnik, Lin and JCN. Tokens of a corpus are counted
+    either as senses, when the token is a SynSet ID of the WordNet, or as words, whose count is shared equally by all
+    SynSets having the word as a literal. The count of every SynSet is then propagated to all SynSets on its path to
+    the root in one topological pass over the hypernym forest, and the information content of a SynSet is the
+    negative logarithm of its share of the total count.
+    """
+
+    MAGIC = b"KENETIC1"
+    HEADER = struct.Struct("<8sI")
+    ENTRY = struct.Struct("<Hd")
+
+    __word_net: WordNet
+    __counts: dict
+    __smoothing: float
+
+    def __init__(self,
+                 wordNet: WordNet,
+                 smoothing: float = 1.0):
+        """
+        Creates an empty count table for the SynSets of a WordNet.
+
+        PARAMETERS
+        ----------
+        wordNet : WordNet
+            WordNet whose SynSets will be counted
+        smoothing : float
+            Count added to every SynSet before the propagation, so that no SynSet has zero probability
+        """
+        self.__word_net = wordNet
+        self.__counts = {}
+        self.__smoothing = smoothing
+
+    def addSense(self,
+                 synSetId: str,
+                 count: float = 1.0):
+        """
+        Adds the occurrences of a sense to the count table.
+
+        PARAMETERS
+        ----------
+        synSetId : str
+            ID of the SynSet of the sense
+        count : float
+            Number of occurrences
+        """
+        self.__counts[synSetId] = self.__counts.get(synSetId, 0.0) + count
+
+    def addWord(self,
+                word: str,
+                count: float = 1.0):
+        """
+        Adds the occurrences of a word to the count table, the count is shared equally by all SynSets having the word
+        as a literal. Words without SynSets are ignored.
+
+        PARAMETERS
+        ----------
+        word : str
+            Word whose occurrences will be counted
+        count : float
+            Number of occurrences
+        """
+        syn_sets = self.__word_net.getSynSetsWithLiteral(word)
+        for syn_set in syn_sets:
+            self.addSense(syn_set.getId(), count / len(syn_sets))
+
+    def addCounts(self, tokenCounts: dict):
+        """
+        Adds the token frequencies of a corpus to the count table. A token is counted as a sense if it is the ID of a
+        SynSet, and as a word otherwise.
+
+        PARAMETERS
+        ----------
+        tokenCounts : dict
+            Number of occurrences of each token
+        """
+        for token, count in tokenCounts.items():
+            if self.__word_net.getSynSetWithId(token) is not None:
+                self.addSense(token, count)
+            else:
+                self.addWord(token, count)
+
+    def addCorpus(self, tokens):
+        """
+        Counts a stream of tokens. The tokens are tallied first, so every distinct token is looked up only once.
+
+        PARAMETERS
+        ----------
+        tokens
+            Iterable of words or SynSet IDs
+        """
+        token_counts = {}
+        for token in tokens:
+            token_counts[token] = token_counts.get(token, 0) + 1
+        self.addCounts(token_counts)
+
+    @staticmethod
+    def countFile(fileName: str) -> dict:
+        """
+        Tallies the whitespace separated tokens of a UTF-8 corpus file.
+
+        PARAMETERS
+        ----------
+        fileName : str
+            Corpus file to be read
+
+        RETURNS
+        -------
+        dict
+            Number of occurrences of each token
+        """
+        token_counts = {}
+        with open(fileName, "r", encoding="utf8") as corpus_file:
+            for line in corpus_file:
+                for token in line.split():
+                    token_counts[token] = token_counts.get(token, 0) + 1
+        return token_counts
+
+    def addFiles(self,
+                 fileNames: list,
+                 processes: int = None):
+        """
+        Counts corpus files in parallel. Every worker process tallies the tokens of one file at a time, the tallies
+        are merged and only the distinct tokens are looked up in the WordNet, so the WordNet is never copied to the
+        workers.
+
+        PARAMETERS
+        ----------
+        fileNames : list
+            Corpus files to be read
+        processes : int
+            Number of worker processes, the number of CPUs if None
+        """
+        token_counts = {}
+        with multiprocessing.Pool(processes) as pool:
+            for file_counts in pool.imap_unordered(InformationContent.countFile, fileNames):
+                for token, count in file_counts.items():
+                    token_counts[token] = token_counts.get(token, 0) + count
+        self.addCounts(token_counts)
+
+    def merge(self, other):
+        """
+        Adds the counts of another count table, for example one filled in another process, to this table.
+
+        PARAMETERS
+        ----------
+        other : InformationContent
+            Count table to be merged
+        """
+        for syn_set_id, count in other.getCounts().items():
+            self.addSense(syn_set_id, count)
+
+    def getCounts(self) -> dict:
+        """
+        Accessor for the counts of the senses before the propagation.
+
+        RETURNS
+        -------
+        dict
+            Count of each SynSet ID
+        """
+        return self.__counts
+
+    def propagateCounts(self) -> dict:
+        """
+        Propagates the smoothed counts up the hypernym forest, so that the count of a SynSet includes the counts of
+        all SynSets having it on their path to the root. Starting from the SynSets without hyponyms, every SynSet
+        passes its total to its parent once all its children are done. SynSets left over lie on hypernym cycles;
+        every SynSet of a cycle is on the path to the root of every other one, so they all get the total of the
+        cycle.
+
+        RETURNS
+        -------
+        dict
+            Propagated count of each SynSet ID
+        """
+        totals = {}
+        parents = {}
+        children = {}
+        for syn_set in self.__word_net.synSetList():
+            totals[syn_set.getId()] = self.__smoothing
+            parent = self.__word_net.percolateUp(syn_set)
+            if parent is not None and parent.getId() != syn_set.getId():
+                parents[syn_set.getId()] = parent.getId()
+                children[parent.getId()] = children.get(parent.getId(), 0) + 1
+        for syn_set_id, count in self.__counts.items():
+            if syn_set_id in totals:
+                totals[syn_set_id] += count
+        ready = [syn_set_id for syn_set_id in totals if syn_set_id not in children]
+        while len(ready) > 0:
+            syn_set_id = ready.pop()
+            parent = parents.pop(syn_set_id, None)
+            if parent is not None:
+                totals[parent] += totals[syn_set_id]
+                children[parent] -= 1
+                if children[parent] == 0:
+                    ready.append(parent)
+        while len(parents) > 0:
+            cycle = [next(iter(parents))]
+            total = totals[cycle[0]]
+            while parents[cycle[-1]] != cycle[0]:
+                cycle.append(parents[cycle[-1]])
+                total += totals[cycle[-1]]
+            for syn_set_id in cycle:
+                totals[syn_set_id] = total
+                parents.pop(syn_set_id)
+        return totals
+
+    def computeInformationContents(self) -> dict:
+        """
+        Computes the information content of every SynSet as the negative logarithm of its propagated count divided
+        by the total count of the corpus.
+
+        RETURNS
+        -------
+        dict
+            Information content of each SynSet ID
+        """
+        total = self.__smoothing * self.__word_net.size()
+        for syn_set_id, count in self.__counts.items():
+            if self.__word_net.getSynSetWithId(syn_set_id) is not None:
+                total += count
+        information_contents = {}
+        for syn_set_id, count in self.propagateCounts().items():
+            if count > 0:
+                information_contents[syn_set_id] = -math.log(count / total)
+        return information_contents
+
+    @staticmethod
+    def save(informationContents: dict, fileName: str):
+        """
+        Writes an information content table to a binary file, every entry is the UTF-8 SynSet ID prefixed by its
+        length followed by the information content as a double.
+
+        PARAMETERS
+        ----------
+        informationContents : dict
+            Information content of each SynSet ID
+        fileName : str
+            File to be written
+        """
+        with open(fileName, "wb") as output_file:
+            output_file.write(InformationContent.HEADER.pack(InformationContent.MAGIC, len(informationContents)))
+            for syn_set_id, information_content in informationContents.items():
+                encoded_id = syn_set_id.encode("utf8")
+                output_file.write(InformationContent.ENTRY.pack(len(encoded_id), information_content))
+                output_file.write(encoded_id)
+
+    @staticmethod
+    def load(fileName: str) -> dict:
+        """
+        Reads an information content table written by save.
+
+        PARAMETERS
+        ----------
+        fileName : str
+            File to be read
+
+        RETURNS
+        -------
+        dict
+            Information content of each SynSet ID
+        """
+        with open(fileName, "rb") as input_file:
+            data = input_file.read()
+        magic, count = InformationContent.HEADER.unpack_from(data, 0)
+        if magic != InformationContent.MAGIC:
+            raise ValueError(fileName + " is not an information content file")
+        information_contents = {}
+        offset = InformationContent.HEADER.size
+        for i in range(count):
+            length, information_content = InformationContent.ENTRY.unpack_from(data, offset)
+            offset += InformationContent.ENTRY.size
+            information_contents[data[offset: offset + length].decode("utf8")] = information_content
+            offset += length
+        return information_contents
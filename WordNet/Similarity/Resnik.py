@@ -1,3 +1,5 @@
+import math
+
 from WordNet.Similarity.ICSimilarity import ICSimilarity
 from WordNet.SynSet import SynSet
 from WordNet.WordNet import WordNet
@@ -9,7 +11,31 @@ class Resnik(ICSimilarity):
         super().__init__(wordNet, informationContents)
 
     def computeSimilarity(self, synSet1: SynSet, synSet2: SynSet) -> float:
-        pathToRootOfSynSet1 = self.wordNet.findPathToRoot(synSet1)
-        pathToRootOfSynSet2 = self.wordNet.findPathToRoot(synSet2)
-        LCSid = self.wordNet.findLCSid(pathToRootOfSynSet1, pathToRootOfSynSet2)
-        return self.informationContents[LCSid]
+        return self.computeSimilarityFromLcs(synSet1, synSet2, self.wordNet.lcs(synSet1, synSet2),
+                                             self.wordNet.depth(synSet1), self.wordNet.depth(synSet2))
+
+    def computeSimilarityFromLcs(self,
+                                 synSet1: SynSet,
+                                 synSet2: SynSet,
+                                 lcs: tuple,
+                                 depth1: int,
+                                 depth2: int) -> float:
+        return self.informationContents[lcs[0]]
+
+    def upperBound(self,
+                   synSet1: SynSet,
+                   synSet2: SynSet,
+                   depth1: int,
+                   depth2: int) -> float:
+        if synSet1.getId() not in self.informationContents or synSet2.getId() not in self.informationContents:
+            return math.inf
+        return min(self.informationContents[synSet1.getId()], self.informationContents[synSet2.getId()])
+
+    def subtreeUpperBound(self,
+                          synSet: SynSet,
+                          lcs: tuple,
+                          depth: int,
+                          subtreeRoot: SynSet,
+                          minDepth: int,
+                          maxDepth: int) -> float:
+        return self.informationContents[lcs[0]]
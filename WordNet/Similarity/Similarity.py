@@ -1,5 +1,11 @@
+import heapq
+import math
 from abc import abstractmethod
 
+from Dictionary.Pos import Pos
+from MorphologicalAnalysis.FsmMorphologicalAnalyzer import FsmMorphologicalAnalyzer
+from MorphologicalAnalysis.MetamorphicParse import MetamorphicParse
+
 from WordNet.SynSet import SynSet
 from WordNet.WordNet import WordNet
 
@@ -7,6 +13,7 @@ from WordNet.WordNet import WordNet
 class Similarity:
 
     wordNet: WordNet
+    __hyponym_tree: tuple
 
     @abstractmethod
     def computeSimilarity(self, synSet1: SynSet, synSet2: SynSet) -> float:
@@ -14,3 +21,359 @@ class Similarity:
 
     def __init__(self, wordNet: WordNet):
         self.wordNet = wordNet
+        self.__hyponym_tree = None
+
+    def computeSimilarityFromLcs(self,
+                                 synSet1: SynSet,
+                                 synSet2: SynSet,
+                                 lcs: tuple,
+                                 depth1: int,
+                                 depth2: int) -> float:
+        """
+        Computes the similarity of two SynSets from their already found least common subsumer. Measures based on the
+        hypernym trees override this method and implement computeSimilarity on top of it, other measures ignore the
+        LCS and fall back to computeSimilarity.
+
+        PARAMETERS
+        ----------
+        synSet1 : SynSet
+            First SynSet
+        synSet2 : SynSet
+            Second SynSet
+        lcs : tuple
+            ID, depth and path length of the LCS of the SynSets, as returned by WordNet.lcs
+        depth1 : int
+            Length of the path to the root of the first SynSet
+        depth2 : int
+            Length of the path to the root of the second SynSet
+
+        RETURNS
+        -------
+        float
+            Similarity of the SynSets
+        """
+        return self.computeSimilarity(synSet1, synSet2)
+
+    def upperBound(self,
+                   synSet1: SynSet,
+                   synSet2: SynSet,
+                   depth1: int,
+                   depth2: int) -> float:
+        """
+        Returns an upper bound of the similarity of two SynSets that can be found without searching their least common
+        subsumer. The bound may assume that the paths to the root of both SynSets end at a root of the hypernym
+        forest, so that their LCS has the same depth seen from either path. Measures that cannot bound their values
+        return infinity.
+
+        PARAMETERS
+        ----------
+        synSet1 : SynSet
+            First SynSet
+        synSet2 : SynSet
+            Second SynSet
+        depth1 : int
+            Length of the path to the root of the first SynSet
+        depth2 : int
+            Length of the path to the root of the second SynSet
+
+        RETURNS
+        -------
+        float
+            Upper bound of the similarity of the SynSets
+        """
+        return math.inf
+
+    def subtreeUpperBound(self,
+                          synSet: SynSet,
+                          lcs: tuple,
+                          depth: int,
+                          subtreeRoot: SynSet,
+                          minDepth: int,
+                          maxDepth: int) -> float:
+        """
+        Returns an upper bound of the similarities of a SynSet to all SynSets in the hyponym subtree of another SynSet,
+        when the LCS of the SynSet with every SynSet of the subtree is the same. The path length of the LCS grows by
+        one with every level below the root of the subtree. Measures that cannot bound their values return infinity.
+
+        PARAMETERS
+        ----------
+        synSet : SynSet
+            SynSet compared to the subtree
+        lcs : tuple
+            ID, depth and path length of the LCS of the SynSet and the root of the subtree
+        depth : int
+            Length of the path to the root of the SynSet
+        subtreeRoot : SynSet
+            Root of the subtree
+        minDepth : int
+            Length of the path to the root of the root of the subtree
+        maxDepth : int
+            Length of the path to the root of the deepest SynSet in the subtree
+
+        RETURNS
+        -------
+        float
+            Upper bound of the similarities of the SynSet to the SynSets of the subtree
+        """
+        return math.inf
+
+    def computeMatrix(self,
+                      synSets1: list,
+                      synSets2: list) -> list:
+        """
+        Computes the similarities of every SynSet in the first list to every SynSet in the second list. The path to
+        the root of each SynSet and the ancestor positions of each SynSet in the second list are found once, every
+        pair then costs a single LCS probe. The results are the same as calling computeSimilarity for each pair.
+
+        PARAMETERS
+        ----------
+        synSets1 : list
+            SynSets of the rows
+        synSets2 : list
+            SynSets of the columns
+
+        RETURNS
+        -------
+        list
+            Row lists, the j'th element of the i'th row is the similarity of synSets1[i] and synSets2[j]
+        """
+        columns = []
+        for syn_set in synSets2:
+            columns.append((syn_set, self.wordNet.ancestors(syn_set), self.wordNet.depth(syn_set)))
+        matrix = []
+        for syn_set1 in synSets1:
+            path_to_root = self.wordNet.pathToRoot(syn_set1)
+            depth1 = len(path_to_root)
+            row = []
+            for syn_set2, ancestors, depth2 in columns:
+                row.append(self.computeSimilarityFromLcs(syn_set1, syn_set2,
+                                                         WordNet.findLCSWithAncestors(path_to_root, ancestors),
+                                                         depth1, depth2))
+            matrix.append(row)
+        return matrix
+
+    def __senses(self,
+                 word: str,
+                 pos: Pos,
+                 fsm: FsmMorphologicalAnalyzer) -> list:
+        """
+        Returns the distinct SynSets of the WordNet with the word as a literal, or, if an analyzer is given, the
+        SynSets constructSynSets finds for the parses of the word.
+        """
+        if fsm is None:
+            candidates = self.wordNet.getSynSetsWithLiteral(word)
+        else:
+            candidates = []
+            parse_list = fsm.morphologicalAnalysis(word)
+            for i in range(parse_list.size()):
+                parse = parse_list.getFsmParse(i)
+                candidates.extend(self.wordNet.constructSynSets(word, parse,
+                                                                MetamorphicParse(parse.getWord().getName()), fsm))
+        senses = []
+        found = set()
+        for syn_set in candidates:
+            if syn_set.getId() not in found and (pos is None or syn_set.getPos() == pos) and \
+                    self.wordNet.getSynSetWithId(syn_set.getId()) is not None:
+                found.add(syn_set.getId())
+                senses.append(syn_set)
+        return senses
+
+    def __isRooted(self, pathToRoot: tuple) -> bool:
+        """
+        Checks whether a path to the root ends at a SynSet without a hypernym, that is, whether it was not cut short
+        by a hypernym cycle.
+        """
+        return self.wordNet.percolateUp(self.wordNet.getSynSetWithId(pathToRoot[-1])) is None
+
+    def __pairSimilarity(self,
+                         row: tuple,
+                         column: tuple) -> float:
+        """
+        Computes the similarity of a sense of the first word, given with its path to the root, and a sense of the
+        second word, given with its path to the root and ancestor positions. Returns None if the senses have no
+        common ancestor or the measure is undefined for them.
+        """
+        lcs = WordNet.findLCSWithAncestors(row[1], column[2])
+        if lcs[0] is None:
+            return None
+        try:
+            return self.computeSimilarityFromLcs(row[0], column[0], lcs, len(row[1]), len(column[1]))
+        except (ValueError, ZeroDivisionError):
+            return None
+
+    def wordSimilarity(self,
+                       word1: str,
+                       word2: str,
+                       pos: Pos = None,
+                       aggregate: str = "max",
+                       fsm: FsmMorphologicalAnalyzer = None) -> float:
+        """
+        Computes the similarity of two words from the similarities of their senses. Pairs of senses without a common
+        ancestor or for which the measure is undefined, such as LCH for a shared sense, are skipped, and senses under
+        different roots are never compared. The path to the root of every sense
+        is found once. For the maximum, the pairs are visited in decreasing order of the upper bounds of their
+        similarities, and the search stops once no remaining pair can beat the best similarity found.
+
+        PARAMETERS
+        ----------
+        word1 : str
+            First word
+        word2 : str
+            Second word
+        pos : Pos
+            If given, only the senses with this part of speech are compared
+        aggregate : str
+            "max" for the similarity of the most similar senses, "avg" for the average similarity of all sense pairs
+        fsm : FsmMorphologicalAnalyzer
+            If given, the words are treated as surface forms, and their senses are found by constructSynSets from
+            their morphological parses, so inflected forms are resolved
+
+        RETURNS
+        -------
+        float
+            Similarity of the words, None if no pair of their senses has a common ancestor
+
+        RAISES
+        ------
+        ValueError
+            If the aggregate is neither "max" nor "avg"
+        """
+        if aggregate != "max" and aggregate != "avg":
+            raise ValueError("Unknown aggregate " + aggregate)
+        rows = []
+        for syn_set in self.__senses(word1, pos, fsm):
+            path_to_root = self.wordNet.pathToRoot(syn_set)
+            rows.append((syn_set, path_to_root, self.__isRooted(path_to_root)))
+        columns = []
+        for syn_set in self.__senses(word2, pos, fsm):
+            path_to_root = self.wordNet.pathToRoot(syn_set)
+            columns.append((syn_set, path_to_root, self.wordNet.ancestors(syn_set), self.__isRooted(path_to_root)))
+        pairs = []
+        for row in rows:
+            for column in columns:
+                if row[2] and column[3]:
+                    if row[1][-1] != column[1][-1]:
+                        continue
+                    bound = self.upperBound(row[0], column[0], len(row[1]), len(column[1]))
+                else:
+                    bound = math.inf
+                pairs.append((bound, row, column))
+        if aggregate == "avg":
+            total = 0.0
+            count = 0
+            for bound, row, column in pairs:
+                similarity = self.__pairSimilarity(row, column)
+                if similarity is not None:
+                    total += similarity
+                    count += 1
+            if count == 0:
+                return None
+            return total / count
+        pairs.sort(key=lambda pair: pair[0], reverse=True)
+        best = None
+        for bound, row, column in pairs:
+            if best is not None and bound <= best:
+                break
+            similarity = self.__pairSimilarity(row, column)
+            if similarity is not None and (best is None or similarity > best):
+                best = similarity
+        return best
+
+    def __hyponymTree(self) -> tuple:
+        """
+        Maps every SynSet ID to the IDs of the SynSets whose path to the root continues with it, and to the number of
+        levels below it. Built on the first call and not updated when the WordNet changes.
+        """
+        if self.__hyponym_tree is None:
+            children = {}
+            heights = {}
+            paths = []
+            for syn_set in self.wordNet.synSetList():
+                path_to_root = self.wordNet.pathToRoot(syn_set)
+                if len(path_to_root) > 1:
+                    children.setdefault(path_to_root[1], []).append(syn_set.getId())
+                    paths.append(path_to_root)
+            paths.sort(key=len, reverse=True)
+            for path_to_root in paths:
+                height = heights.get(path_to_root[0], 0) + 1
+                if heights.get(path_to_root[1], 0) < height:
+                    heights[path_to_root[1]] = height
+            self.__hyponym_tree = (children, heights)
+        return self.__hyponym_tree
+
+    def mostSimilar(self,
+                    synSet: SynSet,
+                    k: int,
+                    pos: Pos = None) -> list:
+        """
+        Finds the k SynSets most similar to a SynSet. Every ancestor of the SynSet is the LCS of the SynSet with itself
+        and with its hyponym subtree, except the part under the previous ancestor. These regions and their subtrees
+        are explored best first, in decreasing order of the bound subtreeUpperBound gives for them, and the search
+        stops once no unexplored subtree can enter the k most similar SynSets. SynSets without a common ancestor with
+        the SynSet, and SynSets for which the measure is undefined, are skipped. Ties at the k'th similarity are
+        broken arbitrarily. The hyponym tree is built on the first call.
+
+        PARAMETERS
+        ----------
+        synSet : SynSet
+            SynSet whose most similar SynSets will be found
+        k : int
+            Number of SynSets to be found
+        pos : Pos
+            If given, only the SynSets with this part of speech are returned
+
+        RETURNS
+        -------
+        list
+            (SynSet, similarity) tuples of the most similar SynSets in decreasing order of similarity
+        """
+        if k <= 0:
+            return []
+        children, heights = self.__hyponymTree()
+        path_to_root = self.wordNet.pathToRoot(synSet)
+        depth = len(path_to_root)
+        frontier = []
+        best = []
+        evaluated = 0
+        visited = set()
+        for i, ancestor_id in enumerate(path_to_root):
+            ancestor = self.wordNet.getSynSetWithId(ancestor_id)
+            if ancestor is None:
+                break
+            visited.add(ancestor_id)
+            lcs = (ancestor_id, depth - i + 1, i - 1)
+            bound = self.subtreeUpperBound(synSet, lcs, depth, ancestor, depth - i,
+                                           depth - i + heights.get(ancestor_id, 0))
+            heapq.heappush(frontier, (-bound, len(visited), ancestor, lcs, depth - i, i > 0))
+        while len(frontier) > 0:
+            bound, _, node, lcs, node_depth, is_candidate = heapq.heappop(frontier)
+            if len(best) == k and -bound <= best[0][0]:
+                break
+            if is_candidate and (pos is None or node.getPos() == pos):
+                node_path = self.wordNet.pathToRoot(node)
+                ancestors = {}
+                for position, syn_set_id in enumerate(node_path):
+                    if syn_set_id not in ancestors:
+                        ancestors[syn_set_id] = position
+                try:
+                    similarity = self.computeSimilarityFromLcs(synSet, node,
+                                                               WordNet.findLCSWithAncestors(path_to_root, ancestors),
+                                                               depth, len(node_path))
+                except (ValueError, ZeroDivisionError):
+                    similarity = None
+                if similarity is not None:
+                    evaluated = evaluated + 1
+                    if len(best) < k:
+                        heapq.heappush(best, (similarity, evaluated, node))
+                    elif similarity > best[0][0]:
+                        heapq.heapreplace(best, (similarity, evaluated, node))
+            child_lcs = (lcs[0], lcs[1], lcs[2] + 1)
+            for child_id in children.get(node.getId(), []):
+                if child_id not in visited:
+                    visited.add(child_id)
+                    child = self.wordNet.getSynSetWithId(child_id)
+                    bound = self.subtreeUpperBound(synSet, child_lcs, depth, child, node_depth + 1,
+                                                   node_depth + 1 + heights.get(child_id, 0))
+                    heapq.heappush(frontier, (-bound, len(visited), child, child_lcs, node_depth + 1, True))
+        best.sort(key=lambda item: item[0], reverse=True)
+        return [(node, similarity) for similarity, _, node in best]
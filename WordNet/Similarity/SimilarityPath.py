@@ -9,8 +9,29 @@ class SimilarityPath(Similarity):
         super().__init__(wordNet)
 
     def computeSimilarity(self, synSet1: SynSet, synSet2: SynSet) -> float:
-        pathToRootOfSynSet1 = self.wordNet.findPathToRoot(synSet1)
-        pathToRootOfSynSet2 = self.wordNet.findPathToRoot(synSet2)
-        pathLength = self.wordNet.findPathLength(pathToRootOfSynSet1, pathToRootOfSynSet2)
-        maxDepth = max(len(pathToRootOfSynSet1), len(pathToRootOfSynSet2))
-        return 2 * maxDepth - pathLength
+        return self.computeSimilarityFromLcs(synSet1, synSet2, self.wordNet.lcs(synSet1, synSet2),
+                                             self.wordNet.depth(synSet1), self.wordNet.depth(synSet2))
+
+    def computeSimilarityFromLcs(self,
+                                 synSet1: SynSet,
+                                 synSet2: SynSet,
+                                 lcs: tuple,
+                                 depth1: int,
+                                 depth2: int) -> float:
+        return 2 * max(depth1, depth2) - lcs[2]
+
+    def upperBound(self,
+                   synSet1: SynSet,
+                   synSet2: SynSet,
+                   depth1: int,
+                   depth2: int) -> float:
+        return 2 * max(depth1, depth2) - abs(depth1 - depth2) + 1
+
+    def subtreeUpperBound(self,
+                          synSet: SynSet,
+                          lcs: tuple,
+                          depth: int,
+                          subtreeRoot: SynSet,
+                          minDepth: int,
+                          maxDepth: int) -> float:
+        return max(2 * max(depth, minDepth) - lcs[2], 2 * max(depth, maxDepth) - lcs[2] - maxDepth + minDepth)
@@ -9,7 +9,29 @@ class WuPalmer(Similarity):
         super().__init__(wordNet)
 
     def computeSimilarity(self, synSet1: SynSet, synSet2: SynSet) -> float:
-        pathToRootOfSynSet1 = self.wordNet.findPathToRoot(synSet1)
-        pathToRootOfSynSet2 = self.wordNet.findPathToRoot(synSet2)
-        LCSDepth = self.wordNet.findLCSDepth(pathToRootOfSynSet1, pathToRootOfSynSet2)
-        return 2 * LCSDepth / (len(pathToRootOfSynSet1) + len(pathToRootOfSynSet2))
+        return self.computeSimilarityFromLcs(synSet1, synSet2, self.wordNet.lcs(synSet1, synSet2),
+                                             self.wordNet.depth(synSet1), self.wordNet.depth(synSet2))
+
+    def computeSimilarityFromLcs(self,
+                                 synSet1: SynSet,
+                                 synSet2: SynSet,
+                                 lcs: tuple,
+                                 depth1: int,
+                                 depth2: int) -> float:
+        return 2 * lcs[1] / (depth1 + depth2)
+
+    def upperBound(self,
+                   synSet1: SynSet,
+                   synSet2: SynSet,
+                   depth1: int,
+                   depth2: int) -> float:
+        return 2 * (min(depth1, depth2) + 1) / (depth1 + depth2)
+
+    def subtreeUpperBound(self,
+                          synSet: SynSet,
+                          lcs: tuple,
+                          depth: int,
+                          subtreeRoot: SynSet,
+                          minDepth: int,
+                          maxDepth: int) -> float:
+        return 2 * lcs[1] / (depth + minDepth)
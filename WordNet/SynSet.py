@@ -12,6 +12,9 @@ from WordNet.Synonym import Synonym
 
 class SynSet:
 
+    __slots__ = ("__id", "__pos", "__definition", "__example", "__synonym", "__relations", "__note", "__wiki_page",
+                 "__bcs", "__word_net")
+
     __id: str
     __pos: Pos
     __definition: list
@@ -21,6 +24,7 @@ class SynSet:
     __note: str
     __wiki_page: str
     __bcs: int
+    __word_net: object
 
     def __init__(self, _id: str):
         """
@@ -38,6 +42,9 @@ class SynSet:
         self.__pos = None
         self.__example = None
         self.__wiki_page = None
+        self.__note = None
+        self.__bcs = None
+        self.__word_net = None
 
     def __eq__(self, other) -> bool:
         """
@@ -243,7 +250,10 @@ class SynSet:
         pos : Pos
             part of speech tag
         """
+        previous_pos = self.__pos
         self.__pos = pos
+        if self.__word_net is not None and previous_pos != pos:
+            self.__word_net.posChanged(self, previous_pos)
 
     def getPos(self) -> Pos:
         """
@@ -300,6 +310,28 @@ class SynSet:
         """
         return self.__wiki_page
 
+    def setWordNet(self, wordNet):
+        """
+        Mutator for the WordNet the SynSet belongs to. The WordNet is notified when relations of the SynSet change.
+
+        PARAMETERS
+        ----------
+        wordNet : WordNet
+            WordNet containing the SynSet, None if the SynSet is removed from it
+        """
+        self.__word_net = wordNet
+
+    def getWordNet(self):
+        """
+        Accessor for the WordNet the SynSet belongs to.
+
+        RETURNS
+        -------
+        WordNet
+            WordNet containing the SynSet, None if the SynSet is not added to a WordNet
+        """
+        return self.__word_net
+
     def addRelation(self, relation: Relation):
         """
         Appends the specified Relation to the end of relations list.
@@ -310,6 +342,8 @@ class SynSet:
             Element to be appended to the list
         """
         self.__relations.append(relation)
+        if self.__word_net is not None:
+            self.__word_net.relationAdded(self, relation)
 
     def removeRelation(self, relationOrName):
         """
@@ -322,13 +356,17 @@ class SynSet:
             Element to be removed from the list, if present
             element to be removed from the list, if present
         """
+        removed = None
         if isinstance(relationOrName, Relation):
             self.__relations.remove(relationOrName)
+            removed = relationOrName
         elif isinstance(relationOrName, str):
             for i in range(len(self.__relations)):
                 if self.__relations[i].getName() == relationOrName:
-                    self.__relations.pop(i)
+                    removed = self.__relations.pop(i)
                     break
+        if removed is not None and self.__word_net is not None:
+            self.__word_net.relationRemoved(self, removed)
 
     def getRelation(self, index: int) -> Relation:
         """
@@ -472,7 +510,7 @@ class SynSet:
             self.setDefinition(self.getLongDefinition() + "|" + synSet.getLongDefinition())
         if synSet.relationSize() != 0:
             for i in range(0, synSet.relationSize()):
-                if not self.containsRelation(synSet.getRelation(i)) and synSet.getRelation(i).getName() != id:
+                if not self.containsRelation(synSet.getRelation(i)) and synSet.getRelation(i).getName() != self.getId():
                     self.addRelation(synSet.getRelation(i))
         if self.__pos is None and synSet.getPos() is not None:
             self.setPos(synSet.getPos())
@@ -3,6 +3,8 @@ from WordNet.Literal import Literal
 
 class Synonym:
 
+    __slots__ = ("__literals",)
+
     __literals: list
 
     def __init__(self):
@@ -1,5 +1,10 @@
+from __future__ import annotations
+
+import gc
+import sys
 import xml.etree.ElementTree
-from collections import OrderedDict
+from collections import OrderedDict, deque
+from collections.abc import ValuesView
 
 import pkg_resources
 
@@ -9,19 +14,40 @@ from MorphologicalAnalysis.FsmMorphologicalAnalyzer import FsmMorphologicalAnaly
 from MorphologicalAnalysis.MetamorphicParse import MetamorphicParse
 from MorphologicalAnalysis.MorphologicalParse import MorphologicalParse
 
+from WordNet.IdMapping import IdMapping
+from WordNet.IdiomTrie import IdiomTrie
+from WordNet.IdiomTrieNode import IdiomTrieNode
 from WordNet.InterlingualRelation import InterlingualRelation
 from WordNet.Literal import Literal
+from WordNet.Relation import Relation
+from WordNet.ResultCache import ResultCache
 from WordNet.SemanticRelation import SemanticRelation
 from WordNet.SemanticRelationType import SemanticRelationType
 from WordNet.SynSet import SynSet
+from WordNet.WordNetSnapshot import WordNetSnapshot
 
 
 class WordNet:
 
+    MIN_INFLECTED_LENGTH = 4
+
     __syn_set_list: OrderedDict
     __literal_list: OrderedDict
     __exception_list: dict
     __interlingual_list: dict
+    __source_checksum: bytes
+    __parents: dict
+    __root_paths: dict
+    __ancestors: dict
+    __pos_list: dict
+    __sense_list: dict
+    __placeholders: dict
+    __construction_cache: ResultCache = None
+    __construction_analyzer: FsmMorphologicalAnalyzer = None
+    __idiom_trie: IdiomTrie = None
+    __inflection_index: dict = None
+    __incoming: dict = None
+    __intervals: dict = None
 
     def __init__(self,
                  fileName: str = None,
@@ -34,85 +60,195 @@ class WordNet:
         fileName : str
             Resource to be read for the WordNet.
         """
-        self.__exception_list = {}
+        self.__initializeLists()
         if fileName is None:
             fileName = pkg_resources.resource_filename(__name__, 'data/turkish_wordnet.xml')
         elif exceptionFileName is not None:
             self.readExceptionFile(exceptionFileName)
+        self.__source_checksum = WordNetSnapshot.fileChecksum(fileName)
+        root = None
+        depth = 0
+        for event, node in xml.etree.ElementTree.iterparse(fileName, events=("start", "end")):
+            if event == "start":
+                if root is None:
+                    root = node
+                depth = depth + 1
+            else:
+                depth = depth - 1
+                if depth == 1:
+                    self.__readSynSetNode(node)
+                    root.clear()
+
+    def __initializeLists(self):
+        """
+        Creates the empty SynSet, literal, exception and interlingual lists, the empty part of speech, sense and
+        hypernym parent indexes and the empty placeholder cache.
+        """
+        self.__parents = {}
+        self.__root_paths = {}
+        self.__ancestors = {}
+        self.__pos_list = {}
+        self.__sense_list = {}
+        self.__placeholders = {}
+        self.__exception_list = {}
         self.__interlingual_list = {}
         self.__syn_set_list = OrderedDict()
         self.__literal_list = OrderedDict()
-        root = xml.etree.ElementTree.parse(fileName).getroot()
+
+    @staticmethod
+    def fromSnapshot(fileName: str, sourceFileName: str = None) -> WordNet:
+        """
+        Creates a WordNet from a binary snapshot written by saveSnapshot. If the source XML file is given, the
+        snapshot is accepted only if it was created from the current contents of that file.
+
+        PARAMETERS
+        ----------
+        fileName : str
+            Snapshot file to be read
+        sourceFileName : str
+            XML file the snapshot is expected to be created from
+
+        RETURNS
+        -------
+        WordNet
+            WordNet identical to the one the snapshot was saved from
+        """
+        snapshot = WordNetSnapshot(fileName)
+        # The SynSets created here refer back to the WordNet, but every such cycle stays reachable, so the collections
+        # the allocations would trigger find no garbage while repeatedly scanning the growing graph; they are paused.
+        gc_enabled = gc.isenabled()
+        gc.disable()
+        try:
+            if sourceFileName is not None and WordNetSnapshot.fileChecksum(sourceFileName) != snapshot.getChecksum():
+                raise ValueError("Snapshot " + fileName + " is stale for " + sourceFileName)
+            word_net = WordNet.__new__(WordNet)
+            word_net.__initializeLists()
+            word_net.__source_checksum = snapshot.getChecksum()
+            strings = snapshot.strings()
+            relations = list(snapshot.records(WordNetSnapshot.RELATIONS, WordNetSnapshot.RELATION))
+            literals = []
+            for literal_record in snapshot.records(WordNetSnapshot.LITERALS, WordNetSnapshot.LITERAL):
+                literals.append(snapshot.createLiteral(literal_record, strings, relations))
+            syn_sets = []
+            for syn_set_record in snapshot.records(WordNetSnapshot.SYN_SETS, WordNetSnapshot.SYN_SET):
+                syn_set = snapshot.createSynSet(syn_set_record, strings, relations, literals)
+                syn_sets.append(syn_set)
+                word_net.addSynSet(syn_set)
+            for literal_index, in snapshot.records(WordNetSnapshot.LITERAL_LIST, WordNetSnapshot.OFFSET):
+                word_net.addLiteralToLiteralList(literals[literal_index])
+            for interlingual_id, syn_set_index in snapshot.records(WordNetSnapshot.INTERLINGUALS,
+                                                                   WordNetSnapshot.INTERLINGUAL):
+                interlingual_id = strings[interlingual_id]
+                if interlingual_id not in word_net.__interlingual_list:
+                    word_net.__interlingual_list[interlingual_id] = []
+                word_net.__interlingual_list[interlingual_id].append(syn_sets[syn_set_index])
+            for exception_record in snapshot.records(WordNetSnapshot.EXCEPTIONS, WordNetSnapshot.EXCEPTION):
+                exceptional_word = snapshot.createExceptionalWord(exception_record, strings)
+                if exceptional_word.getName() not in word_net.__exception_list:
+                    word_net.__exception_list[exceptional_word.getName()] = []
+                word_net.__exception_list[exceptional_word.getName()].append(exceptional_word)
+        finally:
+            if gc_enabled:
+                gc.enable()
+            snapshot.close()
+        return word_net
+
+    def saveSnapshot(self, fileName: str):
+        """
+        Writes the WordNet, including the exceptions, to a binary snapshot that can be read back with fromSnapshot
+        much faster than the XML file.
+
+        PARAMETERS
+        ----------
+        fileName : str
+            Snapshot file to be written
+        """
+        WordNetSnapshot.save(fileName, self.__source_checksum, list(self.__syn_set_list.values()), self.__literal_list,
+                             self.__interlingual_list, self.__exception_list)
+
+    def __readSynSetNode(self, syn_set_node: xml.etree.ElementTree.Element):
+        """
+        Creates the SynSet described by a single SYNSET node, together with its literals and relations, and adds
+        them to the SynSet, literal and interlingual lists. SynSet IDs, relation targets and literal names are interned,
+        so every occurrence of the same ID or name shares a single string object.
+
+        PARAMETERS
+        ----------
+        syn_set_node : xml.etree.ElementTree.Element
+            SYNSET node to be read
+        """
         current_syn_set = None
-        for syn_set_node in root:
-            for part_node in syn_set_node:
-                if part_node.tag == "ID":
-                    current_syn_set = SynSet(part_node.text)
-                    self.addSynSet(current_syn_set)
-                elif part_node.tag == "DEF":
-                    current_syn_set.setDefinition(part_node.text)
-                elif part_node.tag == "EXAMPLE":
-                    current_syn_set.setExample(part_node.text)
-                elif part_node.tag == "WIKI":
-                    current_syn_set.setWikiPage(part_node.text)
-                elif part_node.tag == "BCS":
-                    current_syn_set.setBcs(int(part_node.text))
-                elif part_node.tag == "POS":
-                    if part_node.text == "a":
-                        current_syn_set.setPos(Pos.ADJECTIVE)
-                    elif part_node.text == "v":
-                        current_syn_set.setPos(Pos.VERB)
-                    elif part_node.text == "b":
-                        current_syn_set.setPos(Pos.ADVERB)
-                    elif part_node.text == "n":
-                        current_syn_set.setPos(Pos.NOUN)
-                    elif part_node.text == "i":
-                        current_syn_set.setPos(Pos.INTERJECTION)
-                    elif part_node.text == "c":
-                        current_syn_set.setPos(Pos.CONJUNCTION)
-                    elif part_node.text == "p":
-                        current_syn_set.setPos(Pos.PREPOSITION)
-                    elif part_node.text == "r":
-                        current_syn_set.setPos(Pos.PRONOUN)
-                elif part_node.tag == "SR":
-                    if len(part_node) > 0 and part_node[0].tag == "TYPE":
-                        type_node = part_node[0]
-                        if len(part_node) > 1 and part_node[1].tag == "TO":
-                            to_node = part_node[1]
-                            current_syn_set.addRelation(SemanticRelation(part_node.text, type_node.text, int(to_node.text)))
-                        else:
-                            current_syn_set.addRelation(SemanticRelation(part_node.text, type_node.text))
-                elif part_node.tag == "ILR":
-                    if len(part_node) > 0 and part_node[0].tag == "TYPE":
-                        type_node = part_node[0]
-                        interlingual_id = part_node.text
-                        if interlingual_id in self.__interlingual_list:
-                            syn_set_list = self.__interlingual_list[interlingual_id]
-                        else:
-                            syn_set_list = []
-                        syn_set_list.append(current_syn_set)
-                        self.__interlingual_list[interlingual_id] = syn_set_list
-                        current_syn_set.addRelation(InterlingualRelation(interlingual_id, type_node.text))
-                elif part_node.tag == "SYNONYM":
-                    for literal_node in part_node:
-                        current_literal = None
-                        for child_node in literal_node:
-                            if child_node.tag == "SENSE":
-                                current_literal = Literal(literal_node.text, int(child_node.text), current_syn_set.getId())
-                                current_syn_set.addLiteral(current_literal)
-                                self.addLiteralToLiteralList(current_literal)
-                            elif child_node.tag == "ORIGIN":
-                                current_literal.setOrigin(child_node.text)
-                            elif child_node.tag == "GROUP":
-                                current_literal.setGroupNo(int(child_node.text))
-                            elif child_node.tag == "SR":
-                                type_node = child_node[0]
-                                if len(child_node) > 1 and child_node[1].tag == "TO":
-                                    to_node = child_node[1]
-                                    current_literal.addRelation(
-                                        SemanticRelation(child_node.text, type_node.text, int(to_node.text)))
-                                else:
-                                    current_literal.addRelation(SemanticRelation(child_node.text, type_node.text))
+        for part_node in syn_set_node:
+            if part_node.tag == "ID":
+                current_syn_set = SynSet(sys.intern(part_node.text))
+                self.addSynSet(current_syn_set)
+            elif part_node.tag == "DEF":
+                current_syn_set.setDefinition(part_node.text)
+            elif part_node.tag == "EXAMPLE":
+                current_syn_set.setExample(part_node.text)
+            elif part_node.tag == "WIKI":
+                current_syn_set.setWikiPage(part_node.text)
+            elif part_node.tag == "BCS":
+                current_syn_set.setBcs(int(part_node.text))
+            elif part_node.tag == "POS":
+                if part_node.text == "a":
+                    current_syn_set.setPos(Pos.ADJECTIVE)
+                elif part_node.text == "v":
+                    current_syn_set.setPos(Pos.VERB)
+                elif part_node.text == "b":
+                    current_syn_set.setPos(Pos.ADVERB)
+                elif part_node.text == "n":
+                    current_syn_set.setPos(Pos.NOUN)
+                elif part_node.text == "i":
+                    current_syn_set.setPos(Pos.INTERJECTION)
+                elif part_node.text == "c":
+                    current_syn_set.setPos(Pos.CONJUNCTION)
+                elif part_node.text == "p":
+                    current_syn_set.setPos(Pos.PREPOSITION)
+                elif part_node.text == "r":
+                    current_syn_set.setPos(Pos.PRONOUN)
+            elif part_node.tag == "SR":
+                if len(part_node) > 0 and part_node[0].tag == "TYPE":
+                    type_node = part_node[0]
+                    if len(part_node) > 1 and part_node[1].tag == "TO":
+                        to_node = part_node[1]
+                        current_syn_set.addRelation(SemanticRelation(sys.intern(part_node.text), type_node.text,
+                                                                      int(to_node.text)))
+                    else:
+                        current_syn_set.addRelation(SemanticRelation(sys.intern(part_node.text), type_node.text))
+            elif part_node.tag == "ILR":
+                if len(part_node) > 0 and part_node[0].tag == "TYPE":
+                    type_node = part_node[0]
+                    interlingual_id = sys.intern(part_node.text)
+                    if interlingual_id in self.__interlingual_list:
+                        syn_set_list = self.__interlingual_list[interlingual_id]
+                    else:
+                        syn_set_list = []
+                    syn_set_list.append(current_syn_set)
+                    self.__interlingual_list[interlingual_id] = syn_set_list
+                    current_syn_set.addRelation(InterlingualRelation(interlingual_id, type_node.text))
+            elif part_node.tag == "SYNONYM":
+                for literal_node in part_node:
+                    current_literal = None
+                    for child_node in literal_node:
+                        if child_node.tag == "SENSE":
+                            current_literal = Literal(sys.intern(literal_node.text), int(child_node.text),
+                                                      current_syn_set.getId())
+                            current_syn_set.addLiteral(current_literal)
+                            self.addLiteralToLiteralList(current_literal)
+                        elif child_node.tag == "ORIGIN":
+                            current_literal.setOrigin(child_node.text)
+                        elif child_node.tag == "GROUP":
+                            current_literal.setGroupNo(int(child_node.text))
+                        elif child_node.tag == "SR":
+                            type_node = child_node[0]
+                            if len(child_node) > 1 and child_node[1].tag == "TO":
+                                to_node = child_node[1]
+                                current_literal.addRelation(
+                                    SemanticRelation(sys.intern(child_node.text), type_node.text, int(to_node.text)))
+                            else:
+                                current_literal.addRelation(
+                                    SemanticRelation(sys.intern(child_node.text), type_node.text))
 
     def readExceptionFile(self, exceptionFileName: str):
         """
@@ -144,6 +280,38 @@ class WordNet:
                 wordList = []
             wordList.append(ExceptionalWord(word_name, root_form, pos))
             self.__exception_list[word_name] = wordList
+            if self.__inflection_index is not None and len(word_name) >= WordNet.MIN_INFLECTED_LENGTH:
+                self.__updateInflection(word_name)
+
+    def getExceptionalWords(self, word: str) -> list:
+        """
+        Returns the exceptional words read from the exception file for a specified word form.
+
+        PARAMETERS
+        ----------
+        word : str
+            Word form to be searched in the exception list
+
+        RETURNS
+        -------
+        list
+            A list of ExceptionalWords whose name is the specified word form
+        """
+        if word in self.__exception_list:
+            return self.__exception_list[word]
+        else:
+            return []
+
+    def exceptionList(self) -> list:
+        """
+        Returns the word forms having exceptional words.
+
+        RETURNS
+        -------
+        list
+            Word forms of the exception list
+        """
+        return list(self.__exception_list.keys())
 
     def addLiteralToLiteralList(self, literal: Literal):
         """
@@ -160,6 +328,39 @@ class WordNet:
             literals = []
         literals.append(literal)
         self.__literal_list[literal.getName()] = literals
+        if self.__inflection_index is not None and len(literals) == 1:
+            for rule, form in WordNet.__inflectedForms(literal.getName()):
+                self.__updateInflection(form)
+        if (literal.getName(), literal.getSense()) not in self.__sense_list:
+            self.__sense_list[(literal.getName(), literal.getSense())] = literal
+        self.__clearLookupCaches()
+
+    def __removeDuplicateLiteral(self, literal: Literal):
+        """
+        Removes a literal from the literal list after an equal literal of another SynSet replaced it in a merge, so
+        that the literal name leads to the SynSet only once.
+
+        PARAMETERS
+        ----------
+        literal : Literal
+            Literal to be removed
+        """
+        literals = self.__literal_list.get(literal.getName(), [])
+        for i in range(len(literals)):
+            if literals[i] is literal:
+                literals.pop(i)
+                break
+        if len(literals) == 0 and literal.getName() in self.__literal_list:
+            self.__literal_list.pop(literal.getName())
+            if self.__inflection_index is not None:
+                for rule, form in WordNet.__inflectedForms(literal.getName()):
+                    self.__updateInflection(form)
+        if self.__sense_list.get((literal.getName(), literal.getSense())) is literal:
+            for other in literals:
+                if other == literal:
+                    self.__sense_list[(literal.getName(), literal.getSense())] = other
+                    break
+        self.__clearLookupCaches()
 
     def synSetList(self) -> list:
         """
@@ -192,7 +393,19 @@ class WordNet:
         synSet : SynSet
             SynSet to be added
         """
+        previous = self.__syn_set_list.get(synSet.getId())
+        if previous is not None and previous is not synSet:
+            previous.setWordNet(None)
+            self.__removeFromPosList(previous, previous.getPos())
+            self.__removeIncomingOf(previous.getId(), previous)
+        if previous is not synSet:
+            self.__addIncomingOf(synSet.getId(), synSet)
         self.__syn_set_list[synSet.getId()] = synSet
+        synSet.setWordNet(self)
+        self.__addToPosList(synSet)
+        self.__updateParent(synSet)
+        self.__clearRootPaths()
+        self.__clearLookupCaches()
 
     def removeSynSet(self, synSet: SynSet):
         """
@@ -203,7 +416,13 @@ class WordNet:
         synSet : SynSet
             SynSet to be removed
         """
-        self.__syn_set_list.pop(synSet.getId())
+        removed = self.__syn_set_list.pop(synSet.getId())
+        removed.setWordNet(None)
+        self.__removeFromPosList(removed, removed.getPos())
+        self.__removeIncomingOf(removed.getId(), removed)
+        self.__parents.pop(synSet.getId(), None)
+        self.__clearRootPaths()
+        self.__clearLookupCaches()
 
     def changeSynSetId(self,
                        synSet: SynSet,
@@ -218,9 +437,365 @@ class WordNet:
         newId : str
             new ID
         """
-        self.__syn_set_list.pop(synSet.getId())
+        self.__removeFromPosList(self.__syn_set_list.pop(synSet.getId()), synSet.getPos())
+        parent = self.__parents.pop(synSet.getId(), None)
+        self.__removeIncomingOf(synSet.getId(), synSet)
         synSet.setId(newId)
         self.__syn_set_list[newId] = synSet
+        self.__addToPosList(synSet)
+        self.__addIncomingOf(newId, synSet)
+        if parent is not None:
+            self.__parents[newId] = parent
+        self.__clearRootPaths()
+        self.__clearLookupCaches()
+
+    def applyIdMapping(self, idMapping: IdMapping) -> dict:
+        """
+        Moves the whole WordNet to new SynSet IDs. Every SynSet whose ID is mapped is renamed, or merged into the
+        SynSet already having the new ID. Then every semantic relation of a SynSet or a literal pointing at a mapped
+        ID is redirected to the new ID; the relations to rewrite are found with the incoming relation index, so only
+        the affected SynSets are visited. A redirected relation that duplicates an existing one, or that points at its
+        own SynSet after a merge, is removed. The mapping is compiled first if it is not already.
+
+        PARAMETERS
+        ----------
+        idMapping : IdMapping
+            Mapping from the old SynSet IDs to the new ones
+
+        RETURNS
+        -------
+        dict
+            Report with the (old ID, new ID) pairs of the "renamed" and "merged" SynSets, the number of "rewritten"
+            relations and the (SynSet ID, target ID) pairs of the "dangling" relations whose targets are not in the
+            WordNet after the mapping
+
+        RAISES
+        ------
+        ValueError
+            If the mapping contains a cycle
+        """
+        if not idMapping.isCompiled():
+            idMapping.compile()
+        report = {"renamed": [], "merged": [], "rewritten": 0, "dangling": []}
+        incoming = self.__incomingIndex()
+        for syn_set in list(self.__syn_set_list.values()):
+            old_id = syn_set.getId()
+            new_id = idMapping.map(old_id)
+            if new_id is None or new_id == old_id:
+                continue
+            survivor = self.__syn_set_list.get(new_id)
+            if survivor is None:
+                self.changeSynSetId(syn_set, new_id)
+                report["renamed"].append((old_id, new_id))
+                continue
+            survivor.mergeSynSet(syn_set)
+            for i in range(survivor.getSynonym().literalSize()):
+                survivor.getSynonym().getLiteral(i).setSynSetId(new_id)
+            for i in range(syn_set.getSynonym().literalSize()):
+                literal = syn_set.getSynonym().getLiteral(i)
+                if literal.getSynSetId() != new_id:
+                    literal.setSynSetId(new_id)
+                    self.__removeDuplicateLiteral(literal)
+            for i in range(syn_set.relationSize()):
+                relation = syn_set.getRelation(i)
+                if isinstance(relation, InterlingualRelation):
+                    syn_sets = self.__interlingual_list.get(relation.getName(), [])
+                    if syn_set in syn_sets:
+                        syn_sets.remove(syn_set)
+                    if survivor not in syn_sets:
+                        syn_sets.append(survivor)
+            self.removeSynSet(syn_set)
+            report["merged"].append((old_id, new_id))
+        hyponyms = {}
+        for target_id in list(incoming.keys()):
+            new_id = idMapping.map(target_id)
+            if new_id is None or new_id == target_id:
+                continue
+            for source, relation in list(self.incoming(target_id)):
+                self.__removeIncoming(source.getId(), relation)
+                relation.setName(new_id)
+                report["rewritten"] += 1
+                if new_id == source.getId() or self.__hasIncoming(new_id, source.getId(), relation):
+                    source.removeRelation(relation)
+                else:
+                    self.__addIncoming(source.getId(), relation)
+                    if relation.getRelationType() == SemanticRelationType.HYPERNYM \
+                            or relation.getRelationType() == SemanticRelationType.INSTANCE_HYPERNYM:
+                        hyponyms[source.getId()] = source
+        for syn_set in hyponyms.values():
+            self.__updateParent(syn_set)
+        for syn_set in self.__syn_set_list.values():
+            for i in range(syn_set.getSynonym().literalSize()):
+                literal = syn_set.getSynonym().getLiteral(i)
+                for j in range(literal.relationSize()):
+                    relation = literal.getRelation(j)
+                    new_id = idMapping.map(relation.getName())
+                    if new_id is not None:
+                        relation.setName(new_id)
+                        report["rewritten"] += 1
+        for target_id, by_type in incoming.items():
+            if target_id not in self.__syn_set_list:
+                for by_source in by_type.values():
+                    for source_id in by_source:
+                        report["dangling"].append((source_id, target_id))
+        self.__clearRootPaths()
+        self.__clearLookupCaches()
+        return report
+
+    def __addToPosList(self, synSet: SynSet):
+        """
+        Adds a SynSet to the part of speech index.
+
+        PARAMETERS
+        ----------
+        synSet : SynSet
+            SynSet to be indexed
+        """
+        if synSet.getPos() is not None:
+            if synSet.getPos() not in self.__pos_list:
+                self.__pos_list[synSet.getPos()] = {}
+            self.__pos_list[synSet.getPos()][synSet.getId()] = synSet
+
+    def __removeFromPosList(self,
+                            synSet: SynSet,
+                            pos: Pos):
+        """
+        Removes a SynSet from the part of speech index.
+
+        PARAMETERS
+        ----------
+        synSet : SynSet
+            SynSet to be removed
+        pos : Pos
+            Part of speech tag the SynSet is indexed with
+        """
+        if pos in self.__pos_list and self.__pos_list[pos].get(synSet.getId()) is synSet:
+            self.__pos_list[pos].pop(synSet.getId())
+
+    def __addIncoming(self,
+                      sourceId: str,
+                      relation: Relation):
+        """
+        Adds a semantic relation to the incoming relation index of its target.
+
+        PARAMETERS
+        ----------
+        sourceId : str
+            ID of the SynSet having the relation
+        relation : Relation
+            Relation to be indexed, relations other than SemanticRelations are skipped
+        """
+        if self.__incoming is not None and isinstance(relation, SemanticRelation):
+            if relation.getName() not in self.__incoming:
+                self.__incoming[relation.getName()] = {}
+            by_type = self.__incoming[relation.getName()]
+            if relation.getRelationType() not in by_type:
+                by_type[relation.getRelationType()] = {}
+            by_source = by_type[relation.getRelationType()]
+            if sourceId not in by_source:
+                by_source[sourceId] = []
+            by_source[sourceId].append(relation)
+
+    def __removeIncoming(self,
+                         sourceId: str,
+                         relation: Relation):
+        """
+        Removes a semantic relation from the incoming relation index of its target.
+
+        PARAMETERS
+        ----------
+        sourceId : str
+            ID of the SynSet having the relation
+        relation : Relation
+            Relation to be removed from the index
+        """
+        if self.__incoming is not None and isinstance(relation, SemanticRelation):
+            by_type = self.__incoming.get(relation.getName(), {})
+            by_source = by_type.get(relation.getRelationType(), {})
+            if relation in by_source.get(sourceId, []):
+                by_source[sourceId].remove(relation)
+                if len(by_source[sourceId]) == 0:
+                    by_source.pop(sourceId)
+                    if len(by_source) == 0:
+                        by_type.pop(relation.getRelationType())
+                        if len(by_type) == 0:
+                            self.__incoming.pop(relation.getName())
+
+    def __addIncomingOf(self,
+                        sourceId: str,
+                        synSet: SynSet):
+        """
+        Adds all semantic relations of a SynSet to the incoming relation index.
+        """
+        if self.__incoming is None:
+            return
+        for i in range(synSet.relationSize()):
+            self.__addIncoming(sourceId, synSet.getRelation(i))
+
+    def __removeIncomingOf(self,
+                           sourceId: str,
+                           synSet: SynSet):
+        """
+        Removes all semantic relations of a SynSet from the incoming relation index.
+        """
+        if self.__incoming is None:
+            return
+        for i in range(synSet.relationSize()):
+            self.__removeIncoming(sourceId, synSet.getRelation(i))
+
+    def __incomingIndex(self) -> dict:
+        """
+        Returns the incoming relation index, mapping the ID of every relation target to the relation types pointing
+        at it, and each type to the IDs of the SynSets having such relations and the relations themselves. The index is
+        built on first use and kept up to date afterwards.
+
+        RETURNS
+        -------
+        dict
+            Incoming relation index
+        """
+        if self.__incoming is None:
+            self.__incoming = {}
+            for syn_set in self.__syn_set_list.values():
+                self.__addIncomingOf(syn_set.getId(), syn_set)
+        return self.__incoming
+
+    def incoming(self,
+                 synSetId: str,
+                 types=None):
+        """
+        Generates the semantic relations pointing at a SynSet, such as the HYPONYM relations of its hypernyms or the
+        MEMBER_HOLONYM relations of its members, from the incoming relation index. The first call builds the index
+        with one pass over the SynSet list.
+
+        PARAMETERS
+        ----------
+        synSetId : str
+            ID of the target SynSet
+        types
+            Iterable of SemanticRelationTypes to be generated, all types if None
+
+        RETURNS
+        -------
+        generator
+            A (SynSet, SemanticRelation) tuple for every relation pointing at the SynSet, the SynSet being the one
+            having the relation
+        """
+        by_type = self.__incomingIndex().get(synSetId)
+        if by_type is None:
+            return
+        if types is None:
+            types = list(by_type.keys())
+        for relation_type in types:
+            for source_id, relations in list(by_type.get(relation_type, {}).items()):
+                source = self.__syn_set_list[source_id]
+                for relation in list(relations):
+                    yield source, relation
+
+    def __hasIncoming(self,
+                      synSetId: str,
+                      sourceId: str,
+                      relation: SemanticRelation) -> bool:
+        """
+        Checks whether the SynSet with ID sourceId has the specified relation pointing at the SynSet with ID synSetId.
+        """
+        by_type = self.__incomingIndex().get(synSetId)
+        if by_type is None or relation.getRelationType() not in by_type:
+            return False
+        return relation in by_type[relation.getRelationType()].get(sourceId, [])
+
+    def posChanged(self,
+                   synSet: SynSet,
+                   previousPos: Pos):
+        """
+        Called by a SynSet of this WordNet after its part of speech tag is changed, keeps the part of speech index up
+        to date.
+
+        PARAMETERS
+        ----------
+        synSet : SynSet
+            SynSet whose part of speech tag has changed
+        previousPos : Pos
+            Part of speech tag of the SynSet before the change
+        """
+        if self.__syn_set_list.get(synSet.getId()) is synSet:
+            self.__removeFromPosList(synSet, previousPos)
+            self.__addToPosList(synSet)
+            if self.__construction_cache is not None:
+                self.__construction_cache.clear()
+
+    def __clearRootPaths(self):
+        """
+        Drops the cached paths to the root, the cached ancestor positions and the interval labels after the hypernym
+        trees have changed.
+        """
+        self.__root_paths.clear()
+        self.__ancestors.clear()
+        self.__intervals = None
+
+    def __updateParent(self, synSet: SynSet):
+        """
+        Stores the target of the first HYPERNYM or INSTANCE_HYPERNYM relation of a SynSet in the parent index. The
+        cached paths to the root are dropped if the parent has changed.
+
+        PARAMETERS
+        ----------
+        synSet : SynSet
+            SynSet whose parent will be indexed
+        """
+        parent = None
+        for i in range(synSet.relationSize()):
+            relation = synSet.getRelation(i)
+            if isinstance(relation, SemanticRelation) and \
+                    (relation.getRelationType() == SemanticRelationType.HYPERNYM
+                     or relation.getRelationType() == SemanticRelationType.INSTANCE_HYPERNYM):
+                parent = relation.getName()
+                break
+        if self.__parents.get(synSet.getId()) != parent:
+            if parent is None:
+                self.__parents.pop(synSet.getId())
+            else:
+                self.__parents[synSet.getId()] = parent
+            self.__clearRootPaths()
+
+    def relationAdded(self,
+                      synSet: SynSet,
+                      relation: Relation):
+        """
+        Called by a SynSet of this WordNet after a relation is added to it, keeps the hypernym parent and the incoming
+        relation indexes up to date.
+
+        PARAMETERS
+        ----------
+        synSet : SynSet
+            SynSet whose relations have changed
+        relation : Relation
+            Added relation
+        """
+        self.__addIncoming(synSet.getId(), relation)
+        if synSet.getId() not in self.__parents and isinstance(relation, SemanticRelation) and \
+                (relation.getRelationType() == SemanticRelationType.HYPERNYM
+                 or relation.getRelationType() == SemanticRelationType.INSTANCE_HYPERNYM):
+            self.__parents[synSet.getId()] = relation.getName()
+            self.__clearRootPaths()
+
+    def relationRemoved(self,
+                        synSet: SynSet,
+                        relation: Relation):
+        """
+        Called by a SynSet of this WordNet after a relation is removed from it, keeps the hypernym parent and the
+        incoming relation indexes up to date.
+
+        PARAMETERS
+        ----------
+        synSet : SynSet
+            SynSet whose relations have changed
+        relation : Relation
+            Removed relation
+        """
+        if isinstance(relation, SemanticRelation):
+            self.__removeIncoming(synSet.getId(), relation)
+            self.__updateParent(synSet)
 
     def getSynSetWithId(self, synSetId: str) -> SynSet:
         """
@@ -259,13 +834,89 @@ class WordNet:
         SynSet
             SynSet with the specified literal and sense index
         """
+        current = self.__sense_list.get((literal, sense))
+        if current is not None and current.getName() == literal and current.getSense() == sense:
+            return self.getSynSetWithId(current.getSynSetId())
         if literal in self.__literal_list:
             literals = self.__literal_list[literal]
             for current in literals:
                 if current.getSense() == sense:
+                    self.__sense_list[(literal, sense)] = current
                     return self.getSynSetWithId(current.getSynSetId())
         return None
 
+    def __clearLookupCaches(self):
+        """
+        Drops the resolved placeholders, the idiom trie and the cached results of constructSynSets and
+        constructLiterals after SynSets or literals have changed.
+        """
+        self.__placeholders.clear()
+        self.__idiom_trie = None
+        if self.__construction_cache is not None:
+            self.__construction_cache.clear()
+
+    def enableConstructionCache(self, cacheSize: int):
+        """
+        Starts caching the results of constructSynSets and constructLiterals for the most recently used cacheSize
+        (word, parse, metamorphic parse) inputs. While the cache is enabled, the results are returned as tuples
+        shared between calls. The cache is emptied when SynSets or literals are added or removed, a SynSet ID is
+        changed, a part of speech tag of a SynSet is changed or a different morphological analyzer is passed.
+
+        PARAMETERS
+        ----------
+        cacheSize : int
+            Maximum number of cached results
+        """
+        self.__construction_cache = ResultCache(cacheSize)
+
+    def disableConstructionCache(self):
+        """
+        Stops caching the results of constructSynSets and constructLiterals.
+        """
+        self.__construction_cache = None
+        self.__construction_analyzer = None
+
+    def __useConstructionAnalyzer(self, fsm: FsmMorphologicalAnalyzer):
+        """
+        Empties the construction cache when the results are asked for with a different morphological analyzer than
+        the cached ones, so cached results always belong to the analyzer that is kept referenced here.
+        """
+        if fsm is not self.__construction_analyzer:
+            self.__construction_cache.clear()
+            self.__construction_analyzer = fsm
+
+    def getConstructionCache(self) -> ResultCache:
+        """
+        Accessor for the cache of constructSynSets and constructLiterals, which keeps the hit, miss and eviction
+        counts.
+
+        RETURNS
+        -------
+        ResultCache
+            Cache of the construction results, None if caching is not enabled
+        """
+        return self.__construction_cache
+
+    def getPlaceholderSynSet(self, literal: str) -> SynSet:
+        """
+        Returns the first sense of a placeholder literal, such as "(özel isim)" or "(tarih)", standing for a class of
+        tokens in constructSynSets. Placeholders are resolved on first use and cached until a SynSet or a literal is
+        added or removed, or a SynSet ID is changed.
+
+        PARAMETERS
+        ----------
+        literal : str
+            Placeholder literal
+
+        RETURNS
+        -------
+        SynSet
+            SynSet of the first sense of the placeholder literal
+        """
+        if literal not in self.__placeholders:
+            self.__placeholders[literal] = self.getSynSetWithLiteral(literal, 1)
+        return self.__placeholders[literal]
+
     def numberOfSynSetsWithLiteral(self, literal: str) -> int:
         """
         Returns the number of SynSets with a specified literal.
@@ -285,9 +936,11 @@ class WordNet:
         else:
             return 0
 
-    def getSynSetsWithPartOfSpeech(self, pos: Pos) -> list:
+    def getSynSetsWithPartOfSpeech(self, pos: Pos) -> ValuesView:
         """
-        Returns a list of SynSets with a specified part of speech tag.
+        Returns the SynSets with a specified part of speech tag from the part of speech index. The result is a live
+        read-only view, it is not copied and reflects later changes to the WordNet, so it must not be iterated while
+        SynSets are added, removed or retagged.
 
         PARAMETERS
         ----------
@@ -296,14 +949,37 @@ class WordNet:
 
         RETURNS
         -------
-        list
-            A list of SynSets with a specified part of speech tag
+        ValuesView
+            A view of the SynSets with a specified part of speech tag
         """
-        result = []
-        for syn_set in self.__syn_set_list.values():
-            if syn_set.getPos() is not None and syn_set.getPos() == pos:
-                result.append(syn_set)
-        return result
+        if pos in self.__pos_list:
+            return self.__pos_list[pos].values()
+        return {}.values()
+
+    def getSynSetsWithLiteralAndPos(self,
+                                    literal: str,
+                                    pos: Pos):
+        """
+        Generates the SynSets with specified literal String and part of speech tag, without building a list of all
+        SynSets of the literal first.
+
+        PARAMETERS
+        ----------
+        literal : str
+            literal String to be searched in literal list
+        pos : Pos
+            part of speech tag to be searched in SynSets
+
+        RETURNS
+        -------
+        generator
+            SynSets with specified literal String and part of speech tag
+        """
+        if literal in self.__literal_list:
+            for current in self.__literal_list[literal]:
+                syn_set = self.__syn_set_list.get(current.getSynSetId())
+                if syn_set is not None and syn_set.getPos() == pos:
+                    yield syn_set
 
     def getLiteralsWithName(self, literal: str) -> list:
         """
@@ -340,10 +1016,7 @@ class WordNet:
         pos : Pos
             part of speech tag to be searched in SynSets
         """
-        for current in self.__literal_list[literal]:
-            syn_set = self.getSynSetWithId(current.getSynSetId())
-            if syn_set is not None and syn_set.getPos() == pos:
-                result.append(syn_set)
+        result.extend(self.getSynSetsWithLiteralAndPos(literal, pos))
 
     def getSynSetsWithLiteral(self, literal: str) -> list:
         """
@@ -367,6 +1040,77 @@ class WordNet:
                     result.append(syn_set)
         return result
 
+    @staticmethod
+    def __inflectedForms(lemma: str) -> list:
+        """
+        Inverts the suffix rules of getLiteralsWithPossibleModifiedLiteral, returning every word form the rules would
+        reduce to the specified lemma together with the number of the rule, rules being numbered in the order they are
+        applied. Forms shorter than MIN_INFLECTED_LENGTH are skipped, the rules are applied to them directly.
+        """
+        forms = [(1, lemma + "s"), (2, lemma + "es"), (2, lemma + "ed"), (2, lemma + "er"), (5, lemma + "ing"),
+                 (5, lemma + "est")]
+        if len(lemma) >= 2 and lemma[-1] == lemma[-2]:
+            forms.extend([(3, lemma[:-1] + "ed"), (6, lemma[:-1] + "ing")])
+        if lemma.endswith("e"):
+            forms.extend([(4, lemma[:-1] + "ed"), (4, lemma[:-1] + "er"), (7, lemma[:-1] + "ing"),
+                          (7, lemma[:-1] + "est")])
+        if lemma.endswith("y"):
+            forms.append((8, lemma[:-1] + "ies"))
+        return [(rule, form) for rule, form in forms if len(form) >= WordNet.MIN_INFLECTED_LENGTH]
+
+    def __updateInflection(self, form: str):
+        """
+        Recomputes the candidate lemmas of a word form with the suffix rules after a literal or an exceptional word
+        has been added.
+        """
+        lemmas = tuple(self.__modifiedLiterals(form)[1:])
+        if len(lemmas) > 0:
+            self.__inflection_index[form] = lemmas
+        else:
+            self.__inflection_index.pop(form, None)
+
+    def enableInflectionIndex(self):
+        """
+        Builds an index mapping every word form to the candidate lemmas getLiteralsWithPossibleModifiedLiteral
+        returns for it, so that the method needs a single dictionary access. The index is built once from the
+        exception list and by inverting the suffix rules over the literal list, and is kept up to date when literals
+        are added or an exception file is read. Forms shorter than MIN_INFLECTED_LENGTH still go through the rules.
+        """
+        rules = {}
+        # No cyclic garbage is left behind here, but the allocations would trigger collections that scan the whole
+        # loaded WordNet, whose SynSets refer back to it, so the cyclic garbage collector is paused.
+        gc_enabled = gc.isenabled()
+        gc.disable()
+        try:
+            for lemma in self.literalList():
+                for rule, form in WordNet.__inflectedForms(lemma):
+                    if form not in rules:
+                        rules[form] = []
+                    rules[form].append((rule, lemma))
+            self.__inflection_index = {}
+            for word in self.exceptionList():
+                if len(word) >= WordNet.MIN_INFLECTED_LENGTH:
+                    self.__inflection_index[word] = tuple(exceptional_word.getRoot()
+                                                          for exceptional_word in self.getExceptionalWords(word))
+            for form, lemmas in rules.items():
+                if len(lemmas) > 1:
+                    lemmas.sort(key=lambda item: item[0])
+                if form in self.__inflection_index:
+                    self.__inflection_index[form] += tuple(lemma for rule, lemma in lemmas)
+                elif len(lemmas) == 1:
+                    self.__inflection_index[form] = (lemmas[0][1],)
+                else:
+                    self.__inflection_index[form] = tuple(lemma for rule, lemma in lemmas)
+        finally:
+            if gc_enabled:
+                gc.enable()
+
+    def disableInflectionIndex(self):
+        """
+        Drops the inflection index, getLiteralsWithPossibleModifiedLiteral applies the suffix rules again.
+        """
+        self.__inflection_index = None
+
     def getLiteralsWithPossibleModifiedLiteral(self, literal: str) -> list:
         """
         Finds literals with specified literal String and adds to the newly created literal String list.
@@ -382,29 +1126,44 @@ class WordNet:
         list
             Returns a list of literals with specified literal String
         """
+        if self.__inflection_index is not None and len(literal) >= WordNet.MIN_INFLECTED_LENGTH:
+            result = [literal]
+            if literal in self.__inflection_index:
+                result.extend(self.__inflection_index[literal])
+            return result
+        return self.__modifiedLiterals(literal)
+
+    def __modifiedLiterals(self, literal: str) -> list:
+        """
+        Applies the exception list and the suffix rules of getLiteralsWithPossibleModifiedLiteral to a literal.
+        """
         result = [literal]
         word_without_last_one = literal[:len(literal) - 1]
         word_without_last_two = literal[:len(literal) - 2]
         word_without_last_three = literal[:len(literal) - 3]
-        if literal in self.__exception_list:
-            for exceptional_word in self.__exception_list[literal]:
-                result.append(exceptional_word.getRoot())
-        if literal.endswith("s") and word_without_last_one in self.__literal_list:
+        for exceptional_word in self.getExceptionalWords(literal):
+            result.append(exceptional_word.getRoot())
+        if literal.endswith("s") and self.numberOfSynSetsWithLiteral(word_without_last_one) > 0:
             result.append(word_without_last_one)
         if (literal.endswith("es") or literal.endswith("ed") or literal.endswith("er")) \
-                and word_without_last_two in self.__literal_list:
+                and self.numberOfSynSetsWithLiteral(word_without_last_two) > 0:
             result.append(word_without_last_two)
-        if literal.endswith("ed") and (word_without_last_two + literal[len(literal) - 3]) in self.__literal_list:
+        if literal.endswith("ed") \
+                and self.numberOfSynSetsWithLiteral(word_without_last_two + literal[len(literal) - 3]) > 0:
             result.append(word_without_last_two + literal[len(literal) - 3])
-        if (literal.endswith("ed") or literal.endswith("er")) and (word_without_last_two + "e") in self.__literal_list:
+        if (literal.endswith("ed") or literal.endswith("er")) \
+                and self.numberOfSynSetsWithLiteral(word_without_last_two + "e") > 0:
             result.append(word_without_last_two + "e")
-        if (literal.endswith("ing") or literal.endswith("est")) and word_without_last_three in self.__literal_list:
+        if (literal.endswith("ing") or literal.endswith("est")) \
+                and self.numberOfSynSetsWithLiteral(word_without_last_three) > 0:
             result.append(word_without_last_three)
-        if literal.endswith("ing") and (word_without_last_three + literal[len(literal) - 4]) in self.__literal_list:
+        if literal.endswith("ing") \
+                and self.numberOfSynSetsWithLiteral(word_without_last_three + literal[len(literal) - 4]) > 0:
             result.append(word_without_last_three + literal[len(literal) - 4])
-        if (literal.endswith("ing") or literal.endswith("est")) and (word_without_last_three + "e") in self.__literal_list:
+        if (literal.endswith("ing") or literal.endswith("est")) \
+                and self.numberOfSynSetsWithLiteral(word_without_last_three + "e") > 0:
             result.append(word_without_last_three + "e")
-        if literal.endswith("ies") and (word_without_last_three + "y") in self.__literal_list:
+        if literal.endswith("ies") and self.numberOfSynSetsWithLiteral(word_without_last_three + "y") > 0:
             result.append(word_without_last_three + "y")
         return result
 
@@ -430,7 +1189,7 @@ class WordNet:
         result = []
         modified_literals = self.getLiteralsWithPossibleModifiedLiteral(literal)
         for modified_literal in modified_literals:
-            if modified_literal in self.__literal_list:
+            if self.numberOfSynSetsWithLiteral(modified_literal) > 0:
                 self.addSynSetsWithLiteralToList(result, modified_literal, pos)
         return result
 
@@ -451,7 +1210,7 @@ class WordNet:
         if other_syn_set is not None and SemanticRelation.reverse(semanticRelation.getRelationType()) is not None:
             other_relation = SemanticRelation(synSet.getId(),
                                              SemanticRelation.reverse(semanticRelation.getRelationType()))
-            if not other_syn_set.containsRelation(other_relation):
+            if not self.__hasIncoming(synSet.getId(), other_syn_set.getId(), other_relation):
                 other_syn_set.addRelation(other_relation)
 
     def removeReverseRelation(self,
@@ -471,12 +1230,13 @@ class WordNet:
         if other_syn_set is not None and SemanticRelation.reverse(semanticRelation.getRelationType()) is not None:
             other_relation = SemanticRelation(synSet.getId(),
                                              SemanticRelation.reverse(semanticRelation.getRelationType()))
-            if other_syn_set.containsRelation(other_relation):
+            if self.__hasIncoming(synSet.getId(), other_syn_set.getId(), other_relation):
                 other_syn_set.removeRelation(other_relation)
 
     def equalizeSemanticRelations(self):
         """
-        Loops through the SynSet list and adds the possible reverse relations.
+        Loops through the SynSet list and adds the possible reverse relations. Whether a reverse relation already
+        exists is answered by the incoming relation index, so the whole pass is linear in the number of relations.
         """
         for syn_set in self.__syn_set_list.values():
             for i in range(syn_set.relationSize()):
@@ -505,7 +1265,25 @@ class WordNet:
         RETURNS
         -------
         list
-            A list of literal
+            A list of literal, a tuple if the construction cache is enabled
+        """
+        if self.__construction_cache is None:
+            return self.__constructLiterals(word, parse, metaParse, fsm)
+        self.__useConstructionAnalyzer(fsm)
+        key = ("literals", word, str(parse), str(metaParse))
+        result = self.__construction_cache.get(key)
+        if result is None:
+            result = tuple(self.__constructLiterals(word, parse, metaParse, fsm))
+            self.__construction_cache.add(key, result)
+        return result
+
+    def __constructLiterals(self,
+                            word: str,
+                            parse: MorphologicalParse,
+                            metaParse: MetamorphicParse,
+                            fsm: FsmMorphologicalAnalyzer) -> list:
+        """
+        Creates the literals returned by constructLiterals, without consulting the construction cache.
         """
         result = []
         if parse.size() > 0:
@@ -541,30 +1319,48 @@ class WordNet:
         RETURNS
         -------
         list
-            A list of SynSets
+            A list of SynSets, a tuple if the construction cache is enabled
+        """
+        if self.__construction_cache is None:
+            return self.__constructSynSets(word, parse, metaParse, fsm)
+        self.__useConstructionAnalyzer(fsm)
+        key = ("SynSets", word, str(parse), str(metaParse))
+        result = self.__construction_cache.get(key)
+        if result is None:
+            result = tuple(self.__constructSynSets(word, parse, metaParse, fsm))
+            self.__construction_cache.add(key, result)
+        return result
+
+    def __constructSynSets(self,
+                           word: str,
+                           parse: MorphologicalParse,
+                           metaParse: MetamorphicParse,
+                           fsm: FsmMorphologicalAnalyzer) -> list:
+        """
+        Creates the SynSets returned by constructSynSets, without consulting the construction cache.
         """
         result = []
         if parse.size() > 0:
             if parse.isProperNoun():
-                result.append(self.getSynSetWithLiteral("(özel isim)", 1))
+                result.append(self.getPlaceholderSynSet("(özel isim)"))
             if parse.isTime():
-                result.append(self.getSynSetWithLiteral("(zaman)", 1))
+                result.append(self.getPlaceholderSynSet("(zaman)"))
             if parse.isDate():
-                result.append(self.getSynSetWithLiteral("(tarih)", 1))
+                result.append(self.getPlaceholderSynSet("(tarih)"))
             if parse.isHashTag():
-                result.append(self.getSynSetWithLiteral("(hashtag)", 1))
+                result.append(self.getPlaceholderSynSet("(hashtag)"))
             if parse.isEmail():
-                result.append(self.getSynSetWithLiteral("(email)", 1))
+                result.append(self.getPlaceholderSynSet("(email)"))
             if parse.isOrdinal():
-                result.append(self.getSynSetWithLiteral("(sayı sıra sıfatı)", 1))
+                result.append(self.getPlaceholderSynSet("(sayı sıra sıfatı)"))
             if parse.isPercent():
-                result.append(self.getSynSetWithLiteral("(yüzde)", 1))
+                result.append(self.getPlaceholderSynSet("(yüzde)"))
             if parse.isFraction():
-                result.append(self.getSynSetWithLiteral("(kesir sayı)", 1))
+                result.append(self.getPlaceholderSynSet("(kesir sayı)"))
             if parse.isRange():
-                result.append(self.getSynSetWithLiteral("(sayı aralığı)", 1))
+                result.append(self.getPlaceholderSynSet("(sayı aralığı)"))
             if parse.isReal():
-                result.append(self.getSynSetWithLiteral("(reel sayı)", 1))
+                result.append(self.getPlaceholderSynSet("(reel sayı)"))
             if not parse.isPunctuation() and not parse.isCardinal() and not parse.isReal():
                 possible_words = fsm.getPossibleWords(parse, metaParse)
                 for possible_word in possible_words:
@@ -600,11 +1396,71 @@ class WordNet:
             else:
                 result.extend(self.getSynSetsWithLiteral(word))
             if parse.isCardinal() and len(result) == 0:
-                result.append(self.getSynSetWithLiteral("(tam sayı)", 1))
+                result.append(self.getPlaceholderSynSet("(tam sayı)"))
         else:
             result.extend(self.getSynSetsWithLiteral(word))
         return result
 
+    def constructSynSetsBatch(self,
+                              words: list,
+                              parses: list,
+                              metaParses: list,
+                              fsm: FsmMorphologicalAnalyzer) -> list:
+        """
+        Creates the SynSets of a batch of words, such as the words of a sentence. Words with the same surface form,
+        morphological parse and metamorphic parse are resolved once and share their result.
+
+        PARAMETERS
+        ----------
+        words : list
+            literal Strings to get SynSets with
+        parses : list
+            morphological parses of the words
+        metaParses : list
+            metamorphic parses of the words
+        fsm : FsmMorphologicalAnalyzer
+            finite state machine morphological analyzer to be used at getting possible words
+
+        RETURNS
+        -------
+        list
+            A tuple of SynSets for every word, in the order of the words
+        """
+        resolved = {}
+        result = []
+        for word, parse, meta_parse in zip(words, parses, metaParses):
+            key = (word, str(parse), str(meta_parse))
+            syn_sets = resolved.get(key)
+            if syn_sets is None:
+                syn_sets = tuple(self.constructSynSets(word, parse, meta_parse, fsm))
+                resolved[key] = syn_sets
+            result.append(syn_sets)
+        return result
+
+    def constructSynSetsOfSentences(self,
+                                    sentences,
+                                    fsm: FsmMorphologicalAnalyzer):
+        """
+        Generates the SynSets of a stream of sentences one sentence at a time, so only the current sentence is kept
+        in memory. Every sentence is given as a tuple of its words, morphological parses and metamorphic parses and
+        is resolved with constructSynSetsBatch. Repeated words across sentences are resolved once only if the
+        construction cache is enabled.
+
+        PARAMETERS
+        ----------
+        sentences
+            Iterable of (words, parses, metaParses) tuples
+        fsm : FsmMorphologicalAnalyzer
+            finite state machine morphological analyzer to be used at getting possible words
+
+        RETURNS
+        -------
+        generator
+            A list with a tuple of SynSets for every word of each sentence
+        """
+        for words, parses, meta_parses in sentences:
+            yield self.constructSynSetsBatch(words, parses, meta_parses, fsm)
+
     def constructIdiomLiterals(self,
                                fsm: FsmMorphologicalAnalyzer,
                                morphologicalParse1: MorphologicalParse,
@@ -639,21 +1495,11 @@ class WordNet:
         list
             A list of literals
         """
-        result = []
-        possible_words1 = fsm.getPossibleWords(morphologicalParse1, metaParse1)
-        possible_words2 = fsm.getPossibleWords(morphologicalParse2, metaParse2)
         if morphologicalParse3 is not None and metaParse3 is not None:
-            possible_words3 = fsm.getPossibleWords(morphologicalParse3, metaParse3)
-            for possible_word1 in possible_words1:
-                for possible_word2 in possible_words2:
-                    for possible_word3 in possible_words3:
-                        result.extend(self.getLiteralsWithName(possible_word1 + " " + possible_word2 +
-                                                               " " + possible_word3))
-        else:
-            for possible_word1 in possible_words1:
-                for possible_word2 in possible_words2:
-                    result.extend(self.getLiteralsWithName(possible_word1 + " " + possible_word2))
-        return result
+            return self.constructMultiWordLiterals(fsm, [morphologicalParse1, morphologicalParse2, morphologicalParse3],
+                                                   [metaParse1, metaParse2, metaParse3])
+        return self.constructMultiWordLiterals(fsm, [morphologicalParse1, morphologicalParse2],
+                                               [metaParse1, metaParse2])
 
     def constructIdiomSynSets(self,
                               fsm: FsmMorphologicalAnalyzer,
@@ -689,23 +1535,133 @@ class WordNet:
         list
             A list of SynSets
         """
-        result = []
-        possible_words1 = fsm.getPossibleWords(morphologicalParse1, metaParse1)
-        possible_words2 = fsm.getPossibleWords(morphologicalParse2, metaParse2)
         if morphologicalParse3 is not None and metaParse3 is not None:
-            possible_words3 = fsm.getPossibleWords(morphologicalParse3, metaParse3)
-            for possible_word1 in possible_words1:
-                for possible_word2 in possible_words2:
-                    for possible_word3 in possible_words3:
-                        if self.numberOfSynSetsWithLiteral(possible_word1 + " " + possible_word2 + " "
-                                                           + possible_word3) > 0:
-                            result.extend(self.getSynSetsWithLiteral(possible_word1 + " " + possible_word2 +
-                                                                     " " + possible_word3))
-        else:
-            for possible_word1 in possible_words1:
-                for possible_word2 in possible_words2:
-                    if self.numberOfSynSetsWithLiteral(possible_word1 + " " + possible_word2) > 0:
-                        result.extend(self.getSynSetsWithLiteral(possible_word1 + " " + possible_word2))
+            return self.constructMultiWordSynSets(fsm, [morphologicalParse1, morphologicalParse2, morphologicalParse3],
+                                                  [metaParse1, metaParse2, metaParse3])
+        return self.constructMultiWordSynSets(fsm, [morphologicalParse1, morphologicalParse2],
+                                              [metaParse1, metaParse2])
+
+    def getIdiomTrie(self) -> IdiomTrie:
+        """
+        Returns the word level prefix tree of the multi-word literals. The trie is built on first use and rebuilt
+        after SynSets or literals have changed.
+
+        RETURNS
+        -------
+        IdiomTrie
+            Prefix tree of the multi-word literal names
+        """
+        if self.__idiom_trie is None:
+            self.__idiom_trie = IdiomTrie(self.literalList())
+        return self.__idiom_trie
+
+    def __collectIdiomNames(self,
+                            fsm: FsmMorphologicalAnalyzer,
+                            morphologicalParses: list,
+                            metaParses: list,
+                            possibleWords: list,
+                            index: int,
+                            node: IdiomTrieNode,
+                            result: list):
+        """
+        Follows the trie with every possible word of the word at the specified index and collects the literal names
+        ending at the last word. Possible words of a word are generated only if some literal reaches that word.
+        """
+        if possibleWords[index] is None:
+            possibleWords[index] = fsm.getPossibleWords(morphologicalParses[index], metaParses[index])
+        for possible_word in possibleWords[index]:
+            child = node.getChild(possible_word)
+            if child is None:
+                continue
+            if index == len(morphologicalParses) - 1:
+                if child.getLiteral() is not None:
+                    result.append(child.getLiteral())
+            else:
+                self.__collectIdiomNames(fsm, morphologicalParses, metaParses, possibleWords, index + 1, child,
+                                         result)
+
+    def constructMultiWordLiteralNames(self,
+                                       fsm: FsmMorphologicalAnalyzer,
+                                       morphologicalParses: list,
+                                       metaParses: list) -> list:
+        """
+        Returns the multi-word literal names made of one possible word of every given word, in the order the
+        combinations of the possible words are generated. A combination is abandoned as soon as no literal starts with
+        its first words.
+
+        PARAMETERS
+        ----------
+        fsm : FsmMorphologicalAnalyzer
+            finite state machine morphological analyzer to be used at getting possible words
+        morphologicalParses : list
+            morphological parses of the consecutive words
+        metaParses : list
+            metamorphic parses of the consecutive words
+
+        RETURNS
+        -------
+        list
+            A list of literal names
+        """
+        result = []
+        if len(morphologicalParses) < 2 or len(morphologicalParses) != len(metaParses):
+            return result
+        self.__collectIdiomNames(fsm, morphologicalParses, metaParses, [None] * len(morphologicalParses), 0,
+                                 self.getIdiomTrie().getRoot(), result)
+        return result
+
+    def constructMultiWordLiterals(self,
+                                   fsm: FsmMorphologicalAnalyzer,
+                                   morphologicalParses: list,
+                                   metaParses: list) -> list:
+        """
+        Returns a list of literals using the possible words gathered with the specified morphological parses and
+        metamorphic parses of any number of consecutive words.
+
+        PARAMETERS
+        ----------
+        fsm : FsmMorphologicalAnalyzer
+            finite state machine morphological analyzer to be used at getting possible words
+        morphologicalParses : list
+            morphological parses of the consecutive words
+        metaParses : list
+            metamorphic parses of the consecutive words
+
+        RETURNS
+        -------
+        list
+            A list of literals
+        """
+        result = []
+        for name in self.constructMultiWordLiteralNames(fsm, morphologicalParses, metaParses):
+            result.extend(self.getLiteralsWithName(name))
+        return result
+
+    def constructMultiWordSynSets(self,
+                                  fsm: FsmMorphologicalAnalyzer,
+                                  morphologicalParses: list,
+                                  metaParses: list) -> list:
+        """
+        Returns a list of SynSets using the possible words gathered with the specified morphological parses and
+        metamorphic parses of any number of consecutive words.
+
+        PARAMETERS
+        ----------
+        fsm : FsmMorphologicalAnalyzer
+            finite state machine morphological analyzer to be used at getting possible words
+        morphologicalParses : list
+            morphological parses of the consecutive words
+        metaParses : list
+            metamorphic parses of the consecutive words
+
+        RETURNS
+        -------
+        list
+            A list of SynSets
+        """
+        result = []
+        for name in self.constructMultiWordLiteralNames(fsm, morphologicalParses, metaParses):
+            result.extend(self.getSynSetsWithLiteral(name))
         return result
 
     def sortDefinitions(self):
@@ -790,35 +1746,122 @@ class WordNet:
         int
             Path length
         """
-        for i in range(len(pathToRootOfSynSet1)):
-            if pathToRootOfSynSet1[i] in pathToRootOfSynSet2:
-                found_index = pathToRootOfSynSet2.index(pathToRootOfSynSet1[i])
-                return i + found_index - 1
-        return -1
+        return self.__findLCS(pathToRootOfSynSet1, pathToRootOfSynSet2)[2]
 
     def __findLCS(self,
-                  pathToRootOfSynSet1: list,
-                  pathToRootOfSynSet2: list) -> tuple:
+                  pathToRootOfSynSet1,
+                  pathToRootOfSynSet2) -> tuple:
         """
-        Returns depth and ID of the LCS.
+        Returns ID, depth and path length of the LCS. The LCS is the first SynSet in the first path that is also in
+        the second one, which is found by probing a dictionary that maps every ID in the second path to its position
+        instead of searching the second path for every ID of the first one.
 
         PARAMETERS
         ----------
-        pathToRootOfSynSet1 : list
-            First list of Strings
-        pathToRootOfSynSet2 : list
-            Second list of Strings
+        pathToRootOfSynSet1
+            First list or tuple of Strings
+        pathToRootOfSynSet2
+            Second list or tuple of Strings
 
         RETURNS
         -------
         tuple
-            Depth and ID of the LCS
+            ID, depth and path length of the LCS; None, -1 and -1 if the paths have no common SynSet
         """
-        for i in range(len(pathToRootOfSynSet1)):
-            lcs_id = pathToRootOfSynSet1[i]
-            if lcs_id in pathToRootOfSynSet2:
-                return lcs_id, len(pathToRootOfSynSet1) - i + 1
-        return None
+        return WordNet.findLCSWithAncestors(pathToRootOfSynSet1, self.__positions(pathToRootOfSynSet2))
+
+    @staticmethod
+    def __positions(pathToRoot) -> dict:
+        """
+        Maps every ID in a path to the root to its first position in the path.
+
+        PARAMETERS
+        ----------
+        pathToRoot
+            List or tuple of Strings
+
+        RETURNS
+        -------
+        dict
+            Position of every ID in the path
+        """
+        positions = {}
+        for position, syn_set_id in enumerate(pathToRoot):
+            if syn_set_id not in positions:
+                positions[syn_set_id] = position
+        return positions
+
+    @staticmethod
+    def findLCSWithAncestors(pathToRootOfSynSet1,
+                             ancestorsOfSynSet2: dict) -> tuple:
+        """
+        Returns ID, depth and path length of the first SynSet in the first path that is also in the second path. The
+        second path is given by its ancestor positions, as returned by ancestors, so that it can be reused for many
+        queries.
+
+        PARAMETERS
+        ----------
+        pathToRootOfSynSet1
+            First list or tuple of Strings
+        ancestorsOfSynSet2 : dict
+            Positions of the IDs in the second path
+
+        RETURNS
+        -------
+        tuple
+            ID, depth and path length of the LCS; None, -1 and -1 if the paths have no common SynSet
+        """
+        for i, lcs_id in enumerate(pathToRootOfSynSet1):
+            found_index = ancestorsOfSynSet2.get(lcs_id)
+            if found_index is not None:
+                return lcs_id, len(pathToRootOfSynSet1) - i + 1, i + found_index - 1
+        return None, -1, -1
+
+    def lcs(self,
+            synSet1: SynSet,
+            synSet2: SynSet) -> tuple:
+        """
+        Finds the least common subsumer of two SynSets in their hypernym trees. The path to the root of the first
+        SynSet is probed against the cached ancestor positions of the second one, so a query costs one dictionary
+        lookup per level of the first SynSet instead of a search of the second path per level.
+
+        PARAMETERS
+        ----------
+        synSet1 : SynSet
+            First SynSet
+        synSet2 : SynSet
+            Second SynSet
+
+        RETURNS
+        -------
+        tuple
+            ID, depth and path length of the LCS, as returned by findLCSid, findLCSDepth and findPathLength; None, -1
+            and -1 if the SynSets have no common ancestor
+        """
+        return WordNet.findLCSWithAncestors(self.pathToRoot(synSet1), self.ancestors(synSet2))
+
+    def ancestors(self, synSet: SynSet) -> dict:
+        """
+        Maps the IDs on the path from a SynSet to the root to their positions in the path. The dictionary is cached
+        together with the path of the SynSets of this WordNet and must not be modified.
+
+        PARAMETERS
+        ----------
+        synSet : SynSet
+            SynSet whose ancestors will be found
+
+        RETURNS
+        -------
+        dict
+            Position of every ID in the path to the root, 0 for the SynSet itself
+        """
+        if synSet is None or self.__syn_set_list.get(synSet.getId()) is not synSet:
+            return WordNet.__positions(self.pathToRoot(synSet))
+        positions = self.__ancestors.get(synSet.getId())
+        if positions is None:
+            positions = WordNet.__positions(self.pathToRoot(synSet))
+            self.__ancestors[synSet.getId()] = positions
+        return positions
 
     def findLCSDepth(self,
                      pathToRootOfSynSet1: list,
@@ -838,11 +1881,7 @@ class WordNet:
         int
             LCS depth
         """
-        temp = self.__findLCS(pathToRootOfSynSet1, pathToRootOfSynSet2)
-        if temp is not None:
-            return temp[1]
-        else:
-            return -1
+        return self.__findLCS(pathToRootOfSynSet1, pathToRootOfSynSet2)[1]
 
     def findLCSid(self,
                   pathToRootOfSynSet1: list,
@@ -862,15 +1901,12 @@ class WordNet:
         str
             LCS ID
         """
-        temp = self.__findLCS(pathToRootOfSynSet1, pathToRootOfSynSet2)
-        if temp is not None:
-            return temp[0]
-        else:
-            return None
+        return self.__findLCS(pathToRootOfSynSet1, pathToRootOfSynSet2)[0]
 
     def percolateUp(self, root: SynSet) -> SynSet:
         """
-        Finds the parent of a node. It does not move until the root, instead it goes one level up.
+        Finds the parent of a node. It does not move until the root, instead it goes one level up. The parent of a
+        SynSet of this WordNet is read from the parent index.
 
         PARAMETERS
         ----------
@@ -882,6 +1918,11 @@ class WordNet:
         SynSet
             Parent SynSet
         """
+        if self.getSynSetWithId(root.getId()) is root:
+            parent = self.__parents.get(root.getId())
+            if parent is None:
+                return None
+            return self.__syn_set_list.get(parent)
         for i in range(root.relationSize()):
             r = root.getRelation(i)
             if isinstance(r, SemanticRelation):
@@ -905,10 +1946,361 @@ class WordNet:
         list
             List of String corresponding to nodes in the path
         """
+        return list(self.pathToRoot(synSet))
+
+    def pathToRoot(self, synSet: SynSet) -> tuple:
+        """
+        Returns the IDs of the SynSets on the path from a SynSet to the root of its hypernym tree, starting with the
+        SynSet itself. For the SynSets of this WordNet the path is found by following the parent index and is cached
+        until a SynSet or a hypernym relation is added, removed or renamed. Changing the type or target of a relation
+        already added to a SynSet is not tracked. Other SynSets are percolated up one by one. The walk stops at the
+        first SynSet already on the path, so hypernym cycles do not loop forever.
+
+        PARAMETERS
+        ----------
+        synSet : SynSet
+            SynSet whose root path will be found
+
+        RETURNS
+        -------
+        tuple
+            IDs of the SynSets in the path
+        """
+        if synSet is None:
+            return ()
+        syn_set_id = synSet.getId()
+        if self.__syn_set_list.get(syn_set_id) is not synSet:
+            return self.percolatePathToRoot(synSet)
+        path_to_root = self.__root_paths.get(syn_set_id)
+        if path_to_root is None:
+            path = []
+            visited = set()
+            current = syn_set_id
+            while current is not None and current not in visited and current in self.__syn_set_list:
+                cached = self.__root_paths.get(current)
+                if cached is not None:
+                    for ancestor in cached:
+                        if ancestor in visited:
+                            break
+                        path.append(ancestor)
+                    break
+                visited.add(current)
+                path.append(current)
+                current = self.__parents.get(current)
+            path_to_root = tuple(path)
+            self.__root_paths[syn_set_id] = path_to_root
+        return path_to_root
+
+    def percolatePathToRoot(self, synSet: SynSet) -> tuple:
+        """
+        Finds the path to the root of a SynSet by percolating up one level at a time, without using the parent index.
+        The walk stops at the first SynSet already on the path.
+
+        PARAMETERS
+        ----------
+        synSet : SynSet
+            SynSet whose root path will be found
+
+        RETURNS
+        -------
+        tuple
+            IDs of the SynSets in the path
+        """
         path_to_root = []
-        while synSet is not None:
-            if synSet.getId() in path_to_root:
-                break
+        visited = set()
+        while synSet is not None and synSet.getId() not in visited:
+            visited.add(synSet.getId())
             path_to_root.append(synSet.getId())
             synSet = self.percolateUp(synSet)
-        return path_to_root
+        return tuple(path_to_root)
+
+    def depth(self, synSet: SynSet) -> int:
+        """
+        Returns the number of SynSets on the path from a SynSet to the root of its hypernym tree.
+
+        PARAMETERS
+        ----------
+        synSet : SynSet
+            SynSet whose depth will be found
+
+        RETURNS
+        -------
+        int
+            Length of the path to the root, 1 for a root SynSet
+        """
+        return len(self.pathToRoot(synSet))
+
+    def neighbours(self,
+                   synSet: SynSet,
+                   types=None,
+                   reverseTypes=None):
+        """
+        Generates the SynSets one relation away from a SynSet. Relations of the SynSet are followed forwards, and
+        relations of other SynSets pointing at it are followed backwards using the incoming relation index. Targets
+        missing from the WordNet are skipped.
+
+        PARAMETERS
+        ----------
+        synSet : SynSet
+            SynSet whose neighbours will be generated
+        types
+            Collection of SemanticRelationTypes followed forwards, all types if None
+        reverseTypes
+            Collection of SemanticRelationTypes followed backwards, none if None
+
+        RETURNS
+        -------
+        generator
+            Neighbouring SynSets, a SynSet is generated once for every relation leading to it
+        """
+        for i in range(synSet.relationSize()):
+            relation = synSet.getRelation(i)
+            if isinstance(relation, SemanticRelation) and (types is None or relation.getRelationType() in types):
+                target = self.getSynSetWithId(relation.getName())
+                if target is not None:
+                    yield target
+        if reverseTypes is not None:
+            for source, relation in self.incoming(synSet.getId(), reverseTypes):
+                yield source
+
+    def traverse(self,
+                 synSet: SynSet,
+                 types=None,
+                 reverseTypes=None,
+                 maxDepth: int = None,
+                 depthFirst: bool = False):
+        """
+        Walks the graph of semantic relations starting from a SynSet, breadth first or depth first, generating every
+        reachable SynSet once. The walk is lazy, it advances only as far as the consumer reads, so breaking out of
+        the loop stops it.
+
+        PARAMETERS
+        ----------
+        synSet : SynSet
+            SynSet to start from, it is not generated itself
+        types
+            Collection of SemanticRelationTypes followed forwards, all types if None
+        reverseTypes
+            Collection of SemanticRelationTypes followed backwards, none if None
+        maxDepth : int
+            Maximum number of relations between the start and a generated SynSet, unlimited if None
+        depthFirst : bool
+            True for a depth first walk, False for a breadth first walk
+
+        RETURNS
+        -------
+        generator
+            A (SynSet, depth) tuple for every reachable SynSet, depth being the number of relations followed. A
+            breadth first walk gives the shortest distance, a depth first walk the length of the path it took first
+        """
+        if types is not None:
+            types = set(types)
+        if reverseTypes is not None:
+            reverseTypes = set(reverseTypes)
+        visited = {synSet.getId(): 0}
+        if depthFirst:
+            stack = [(0, self.neighbours(synSet, types, reverseTypes))]
+            while len(stack) > 0:
+                depth, neighbours = stack[-1]
+                next_syn_set = next(neighbours, None)
+                if next_syn_set is None:
+                    stack.pop()
+                    continue
+                if next_syn_set.getId() not in visited:
+                    visited[next_syn_set.getId()] = depth + 1
+                    yield next_syn_set, depth + 1
+                elif maxDepth is None or visited[next_syn_set.getId()] <= depth + 1:
+                    continue
+                else:
+                    # Reached again by a shorter path, SynSets below it may now be within the depth limit.
+                    visited[next_syn_set.getId()] = depth + 1
+                if maxDepth is None or depth + 1 < maxDepth:
+                    stack.append((depth + 1, self.neighbours(next_syn_set, types, reverseTypes)))
+        else:
+            queue = deque([(synSet, 0)])
+            while len(queue) > 0:
+                current, depth = queue.popleft()
+                if maxDepth is not None and depth >= maxDepth:
+                    continue
+                for next_syn_set in self.neighbours(current, types, reverseTypes):
+                    if next_syn_set.getId() not in visited:
+                        visited[next_syn_set.getId()] = depth + 1
+                        yield next_syn_set, depth + 1
+                        queue.append((next_syn_set, depth + 1))
+
+    def hyponymClosure(self,
+                       synSet: SynSet,
+                       maxDepth: int = None):
+        """
+        Generates all hyponyms and instance hyponyms of a SynSet, direct ones first. Both the hyponym relations of the
+        SynSet and the hypernym relations pointing at it are followed, so the closure is complete even if the reverse
+        relations are not equalized.
+
+        PARAMETERS
+        ----------
+        synSet : SynSet
+            SynSet whose hyponyms will be generated
+        maxDepth : int
+            Maximum number of levels below the SynSet, unlimited if None
+
+        RETURNS
+        -------
+        generator
+            Hyponyms of the SynSet
+        """
+        for hyponym, depth in self.traverse(synSet,
+                                            [SemanticRelationType.HYPONYM, SemanticRelationType.INSTANCE_HYPONYM],
+                                            [SemanticRelationType.HYPERNYM, SemanticRelationType.INSTANCE_HYPERNYM],
+                                            maxDepth):
+            yield hyponym
+
+    def meronymClosure(self,
+                       synSet: SynSet,
+                       maxDepth: int = None):
+        """
+        Generates all member, substance and part meronyms of a SynSet, direct ones first. Both the meronym relations
+        of the SynSet and the holonym relations pointing at it are followed.
+
+        PARAMETERS
+        ----------
+        synSet : SynSet
+            SynSet whose meronyms will be generated
+        maxDepth : int
+            Maximum number of levels below the SynSet, unlimited if None
+
+        RETURNS
+        -------
+        generator
+            Meronyms of the SynSet
+        """
+        for meronym, depth in self.traverse(synSet,
+                                            [SemanticRelationType.MEMBER_MERONYM,
+                                             SemanticRelationType.SUBSTANCE_MERONYM,
+                                             SemanticRelationType.PART_MERONYM],
+                                            [SemanticRelationType.MEMBER_HOLONYM,
+                                             SemanticRelationType.SUBSTANCE_HOLONYM,
+                                             SemanticRelationType.PART_HOLONYM],
+                                            maxDepth):
+            yield meronym
+
+    def __hypernymIntervals(self) -> dict:
+        """
+        Labels the hypernym forest given by the parent index with preorder intervals, so that a SynSet is on the path
+        to the root of another exactly when its interval contains the start of the other's. Every hypernym cycle is
+        collapsed into one node sharing a single interval, since every SynSet of a cycle is on the path to the root of
+        every other one. Roots and children are visited in the order of their smallest ID, so the labels do not
+        depend on the order the SynSets were added. The labels are computed on first use and dropped whenever the
+        hypernym trees change.
+
+        RETURNS
+        -------
+        dict
+            (start, end) preorder interval of every SynSet ID
+        """
+        if self.__intervals is not None:
+            return self.__intervals
+        component = {}
+        state = {}
+        for syn_set_id in self.__syn_set_list:
+            path = []
+            current = syn_set_id
+            while current is not None and current in self.__syn_set_list and current not in state:
+                state[current] = len(path)
+                path.append(current)
+                current = self.__parents.get(current)
+            if current is not None and current in self.__syn_set_list and current not in component:
+                cycle = path[state[current]:]
+                representative = min(cycle)
+                for member in cycle:
+                    component[member] = representative
+            for member in path:
+                if member not in component:
+                    component[member] = member
+        children = {}
+        roots = []
+        for syn_set_id, representative in component.items():
+            if syn_set_id != representative:
+                continue
+            parent = self.__parents.get(syn_set_id)
+            if parent is None or parent not in component or component[parent] == representative:
+                roots.append(representative)
+            else:
+                if component[parent] not in children:
+                    children[component[parent]] = []
+                children[component[parent]].append(representative)
+        intervals = {}
+        counter = 0
+        for root in sorted(roots, reverse=True):
+            stack = [(root, False)]
+            while len(stack) > 0:
+                node, finished = stack.pop()
+                if finished:
+                    intervals[node] = (intervals[node], counter - 1)
+                    continue
+                intervals[node] = counter
+                counter = counter + 1
+                stack.append((node, True))
+                for child in sorted(children.get(node, []), reverse=True):
+                    stack.append((child, False))
+        self.__intervals = {}
+        for syn_set_id, representative in component.items():
+            self.__intervals[syn_set_id] = intervals[representative]
+        return self.__intervals
+
+    def isA(self,
+            synSet: SynSet,
+            ancestor: SynSet) -> bool:
+        """
+        Checks whether a SynSet is a kind of another one, that is, whether the other SynSet is on its path to the root.
+        Every SynSet is a kind of itself. For the SynSets of this WordNet the answer is read from the interval labels
+        of the hypernym forest in constant time.
+
+        PARAMETERS
+        ----------
+        synSet : SynSet
+            SynSet to be checked
+        ancestor : SynSet
+            Possible ancestor
+
+        RETURNS
+        -------
+        bool
+            True if the ancestor is on the path from the SynSet to the root, False otherwise
+        """
+        if self.__syn_set_list.get(synSet.getId()) is not synSet:
+            return ancestor.getId() in self.pathToRoot(synSet)
+        intervals = self.__hypernymIntervals()
+        ancestor_interval = intervals.get(ancestor.getId())
+        if ancestor_interval is None:
+            return False
+        return ancestor_interval[0] <= intervals[synSet.getId()][0] <= ancestor_interval[1]
+
+    def filterByAncestor(self,
+                         candidates: list,
+                         ancestor: SynSet) -> list:
+        """
+        Selects the candidates that are a kind of the specified ancestor, keeping their order.
+
+        PARAMETERS
+        ----------
+        candidates : list
+            SynSets to be filtered
+        ancestor : SynSet
+            SynSet the selected candidates descend from
+
+        RETURNS
+        -------
+        list
+            Candidates having the ancestor on their path to the root
+        """
+        intervals = self.__hypernymIntervals()
+        ancestor_interval = intervals.get(ancestor.getId())
+        result = []
+        for candidate in candidates:
+            if self.__syn_set_list.get(candidate.getId()) is not candidate:
+                if ancestor.getId() in self.pathToRoot(candidate):
+                    result.append(candidate)
+            elif ancestor_interval is not None and \
+                    ancestor_interval[0] <= intervals[candidate.getId()][0] <= ancestor_interval[1]:
+                result.append(candidate)
+        return result
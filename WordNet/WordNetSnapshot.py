@@ -0,0 +1,584 @@
+import hashlib
+import mmap
+import struct
+
+from Dictionary.ExceptionalWord import ExceptionalWord
+from Dictionary.Pos import Pos
+
+from WordNet.InterlingualDependencyType import InterlingualDependencyType
+from WordNet.InterlingualRelation import InterlingualRelation
+from WordNet.Literal import Literal
+from WordNet.Relation import Relation
+from WordNet.SemanticRelation import SemanticRelation
+from WordNet.SemanticRelationType import SemanticRelationType
+from WordNet.SynSet import SynSet
+
+
+class WordNetSnapshot:
+    """
+    Binary snapshot of a WordNet. The file starts with a header holding the format version and the SHA-256 checksum
+    of the XML file the WordNet was read from, followed by a section table. Strings are stored once in a string
+    table; SynSets, literals, relations, literal list entries, interlingual list entries and exceptions are stored
+    as fixed-width little endian records that refer to the string table and to each other by index. Three index
+    sections list SynSets by ID, literals by name and interlingual entries by ID in sorted order, so that single
+    records can be found by binary search directly in the mapped file.
+    """
+
+    MAGIC = b"KENETSNP"
+    VERSION = 2
+    NONE = 0xFFFFFFFF
+
+    HEADER = struct.Struct("<8sH32s")
+    SECTION = struct.Struct("<QI")
+    OFFSET = struct.Struct("<I")
+    SYN_SET = struct.Struct("<IBIIIIBIHIH")
+    LITERAL = struct.Struct("<IiIIiIH")
+    RELATION = struct.Struct("<BIBi")
+    INTERLINGUAL = struct.Struct("<II")
+    EXCEPTION = struct.Struct("<IIB")
+
+    STRING_OFFSETS = 0
+    STRINGS = 1
+    SYN_SETS = 2
+    LITERALS = 3
+    RELATIONS = 4
+    LITERAL_LIST = 5
+    INTERLINGUALS = 6
+    EXCEPTIONS = 7
+    SYN_SET_INDEX = 8
+    LITERAL_INDEX = 9
+    INTERLINGUAL_INDEX = 10
+    SECTION_COUNT = 11
+
+    SEMANTIC_RELATION = 0
+    INTERLINGUAL_RELATION = 1
+
+    POS_TAGS = [None] + list(Pos)
+    SEMANTIC_RELATION_TYPES = [None] + list(SemanticRelationType)
+    INTERLINGUAL_DEPENDENCY_TAGS = [None] + [InterlingualRelation.interlingual_dependency[
+                                                 InterlingualRelation.interlingual_dependency_tags.index(tag)]
+                                             for tag in InterlingualDependencyType]
+
+    __file = None
+    __buffer: mmap.mmap
+    __checksum: bytes
+    __sections: list
+
+    def __init__(self, fileName: str):
+        """
+        Opens a snapshot file and maps it into memory. The header and the section table are validated, records are
+        decoded only when they are asked for.
+
+        PARAMETERS
+        ----------
+        fileName : str
+            Snapshot file to be opened
+        """
+        self.__file = open(fileName, "rb")
+        self.__buffer = mmap.mmap(self.__file.fileno(), 0, access=mmap.ACCESS_READ)
+        if len(self.__buffer) < WordNetSnapshot.HEADER.size:
+            self.close()
+            raise ValueError(fileName + " is not a WordNet snapshot")
+        magic, version, self.__checksum = WordNetSnapshot.HEADER.unpack_from(self.__buffer, 0)
+        if magic != WordNetSnapshot.MAGIC:
+            self.close()
+            raise ValueError(fileName + " is not a WordNet snapshot")
+        if version != WordNetSnapshot.VERSION:
+            self.close()
+            raise ValueError(fileName + " has snapshot version " + str(version) + ", expected " +
+                             str(WordNetSnapshot.VERSION))
+        self.__sections = []
+        position = WordNetSnapshot.HEADER.size
+        for i in range(WordNetSnapshot.SECTION_COUNT):
+            self.__sections.append(WordNetSnapshot.SECTION.unpack_from(self.__buffer, position))
+            position += WordNetSnapshot.SECTION.size
+
+    def close(self):
+        """
+        Releases the memory map and the underlying file.
+        """
+        if self.__file is not None:
+            self.__buffer.close()
+            self.__file.close()
+            self.__file = None
+
+    def getChecksum(self) -> bytes:
+        """
+        Accessor for the checksum of the source XML file.
+
+        RETURNS
+        -------
+        bytes
+            SHA-256 digest of the XML file the snapshot was created from
+        """
+        return self.__checksum
+
+    def count(self, section: int) -> int:
+        """
+        Returns the number of records in a section.
+
+        PARAMETERS
+        ----------
+        section : int
+            Section index
+
+        RETURNS
+        -------
+        int
+            Number of records in the section
+        """
+        return self.__sections[section][1]
+
+    def record(self, section: int, recordStruct: struct.Struct, index: int) -> tuple:
+        """
+        Decodes a single record of a section.
+
+        PARAMETERS
+        ----------
+        section : int
+            Section index
+        recordStruct : struct.Struct
+            Layout of the records in the section
+        index : int
+            Index of the record in the section
+
+        RETURNS
+        -------
+        tuple
+            Fields of the record
+        """
+        return recordStruct.unpack_from(self.__buffer, self.__sections[section][0] + index * recordStruct.size)
+
+    def records(self, section: int, recordStruct: struct.Struct):
+        """
+        Iterates over all records of a section.
+
+        PARAMETERS
+        ----------
+        section : int
+            Section index
+        recordStruct : struct.Struct
+            Layout of the records in the section
+
+        RETURNS
+        -------
+        iterator
+            Fields of the records in file order
+        """
+        offset, count = self.__sections[section]
+        return recordStruct.iter_unpack(self.__buffer[offset: offset + count * recordStruct.size])
+
+    def stringBytes(self, index: int) -> bytes:
+        """
+        Returns the UTF-8 encoded bytes of a single string of the string table.
+
+        PARAMETERS
+        ----------
+        index : int
+            Index of the string
+
+        RETURNS
+        -------
+        bytes
+            Encoded string
+        """
+        offset = self.__sections[WordNetSnapshot.STRINGS][0]
+        start = WordNetSnapshot.OFFSET.unpack_from(self.__buffer, self.__sections[WordNetSnapshot.STRING_OFFSETS][0] +
+                                                   index * WordNetSnapshot.OFFSET.size)[0]
+        end = WordNetSnapshot.OFFSET.unpack_from(self.__buffer, self.__sections[WordNetSnapshot.STRING_OFFSETS][0] +
+                                                 (index + 1) * WordNetSnapshot.OFFSET.size)[0]
+        return self.__buffer[offset + start: offset + end - 1]
+
+    def string(self, index: int) -> str:
+        """
+        Decodes a single string of the string table.
+
+        PARAMETERS
+        ----------
+        index : int
+            Index of the string, NONE for a missing string
+
+        RETURNS
+        -------
+        str
+            The string, None if index is NONE
+        """
+        if index == WordNetSnapshot.NONE:
+            return None
+        return self.stringBytes(index).decode("utf8")
+
+    def findRange(self,
+                  indexSection: int,
+                  section: int,
+                  recordStruct: struct.Struct,
+                  key: str) -> range:
+        """
+        Binary searches an index section for the records whose first field refers to the given string.
+
+        PARAMETERS
+        ----------
+        indexSection : int
+            Index section listing record indexes of section in sorted order
+        section : int
+            Section the index refers to
+        recordStruct : struct.Struct
+            Layout of the records in section
+        key : str
+            String to be searched
+
+        RETURNS
+        -------
+        range
+            Positions in the index section whose records refer to the key
+        """
+        encoded = key.encode("utf8")
+        low = 0
+        high = self.count(indexSection)
+        while low < high:
+            middle = (low + high) // 2
+            if self.__keyAt(indexSection, section, recordStruct, middle) < encoded:
+                low = middle + 1
+            else:
+                high = middle
+        start = low
+        high = self.count(indexSection)
+        while low < high:
+            middle = (low + high) // 2
+            if encoded < self.__keyAt(indexSection, section, recordStruct, middle):
+                high = middle
+            else:
+                low = middle + 1
+        return range(start, low)
+
+    def __keyAt(self,
+                indexSection: int,
+                section: int,
+                recordStruct: struct.Struct,
+                position: int) -> bytes:
+        record_index = self.record(indexSection, WordNetSnapshot.OFFSET, position)[0]
+        return self.stringBytes(self.record(section, recordStruct, record_index)[0])
+
+    def saveAs(self, fileName: str):
+        """
+        Writes a copy of the snapshot file.
+
+        PARAMETERS
+        ----------
+        fileName : str
+            File to be written
+        """
+        with open(fileName, "wb") as out_file:
+            out_file.write(self.__buffer)
+
+    def strings(self) -> list:
+        """
+        Decodes the whole string table at once.
+
+        RETURNS
+        -------
+        list
+            All strings of the string table in index order
+        """
+        offset, size = self.__sections[WordNetSnapshot.STRINGS]
+        if size == 0:
+            return []
+        return self.__buffer[offset: offset + size - 1].decode("utf8").split("\0")
+
+    def createRelation(self,
+                       relationRecord: tuple,
+                       strings: list = None) -> Relation:
+        """
+        Creates a relation object from a relation record.
+
+        PARAMETERS
+        ----------
+        relationRecord : tuple
+            Fields of a relation record
+        strings : list
+            Decoded string table, if None strings are decoded one by one
+
+        RETURNS
+        -------
+        Relation
+            SemanticRelation or InterlingualRelation described by the record
+        """
+        kind, name, relation_type, to_index = relationRecord
+        if strings is not None:
+            name = strings[name]
+        else:
+            name = self.string(name)
+        if kind == WordNetSnapshot.SEMANTIC_RELATION:
+            return SemanticRelation(name, WordNetSnapshot.SEMANTIC_RELATION_TYPES[relation_type], to_index)
+        else:
+            return InterlingualRelation(name, WordNetSnapshot.INTERLINGUAL_DEPENDENCY_TAGS[relation_type])
+
+    def __relationRecords(self,
+                          first: int,
+                          count: int,
+                          relations: list) -> list:
+        if relations is not None:
+            return relations[first: first + count]
+        return [self.record(WordNetSnapshot.RELATIONS, WordNetSnapshot.RELATION, i)
+                for i in range(first, first + count)]
+
+    def createLiteral(self,
+                      literalRecord: tuple,
+                      strings: list = None,
+                      relations: list = None) -> Literal:
+        """
+        Creates a literal object, together with its relations, from a literal record.
+
+        PARAMETERS
+        ----------
+        literalRecord : tuple
+            Fields of a literal record
+        strings : list
+            Decoded string table, if None strings are decoded one by one
+        relations : list
+            Decoded relation records, if None relation records are decoded one by one
+
+        RETURNS
+        -------
+        Literal
+            Literal described by the record
+        """
+        name, sense, syn_set_id, origin, group_no, first_relation, relation_count = literalRecord
+        if strings is not None:
+            literal = Literal(strings[name], sense, strings[syn_set_id])
+            if origin != WordNetSnapshot.NONE:
+                literal.setOrigin(strings[origin])
+        else:
+            literal = Literal(self.string(name), sense, self.string(syn_set_id))
+            literal.setOrigin(self.string(origin))
+        literal.setGroupNo(group_no)
+        if relation_count > 0:
+            for relation_record in self.__relationRecords(first_relation, relation_count, relations):
+                literal.addRelation(self.createRelation(relation_record, strings))
+        return literal
+
+    def createSynSet(self,
+                     synSetRecord: tuple,
+                     strings: list = None,
+                     relations: list = None,
+                     literals: list = None) -> SynSet:
+        """
+        Creates a SynSet object, together with its literals and relations, from a SynSet record.
+
+        PARAMETERS
+        ----------
+        synSetRecord : tuple
+            Fields of a SynSet record
+        strings : list
+            Decoded string table, if None strings are decoded one by one
+        relations : list
+            Decoded relation records, if None relation records are decoded one by one
+        literals : list
+            Already created literals in record order, if None the literals of the SynSet are created
+
+        RETURNS
+        -------
+        SynSet
+            SynSet described by the record
+        """
+        _id, pos, definition, example, wiki_page, note, bcs, first_literal, literal_count, first_relation, \
+            relation_count = synSetRecord
+        if strings is None:
+            syn_set = SynSet(self.string(_id))
+            syn_set.setDefinition(self.string(definition))
+            syn_set.setExample(self.string(example))
+            syn_set.setWikiPage(self.string(wiki_page))
+            syn_set.setNote(self.string(note))
+        else:
+            syn_set = SynSet(strings[_id])
+            if definition != WordNetSnapshot.NONE:
+                syn_set.setDefinition(strings[definition])
+            if example != WordNetSnapshot.NONE:
+                syn_set.setExample(strings[example])
+            if wiki_page != WordNetSnapshot.NONE:
+                syn_set.setWikiPage(strings[wiki_page])
+            if note != WordNetSnapshot.NONE:
+                syn_set.setNote(strings[note])
+        if pos != 0:
+            syn_set.setPos(WordNetSnapshot.POS_TAGS[pos])
+        if bcs != 0:
+            syn_set.setBcs(bcs)
+        for i in range(first_literal, first_literal + literal_count):
+            if literals is not None:
+                syn_set.addLiteral(literals[i])
+            else:
+                syn_set.addLiteral(self.createLiteral(self.record(WordNetSnapshot.LITERALS, WordNetSnapshot.LITERAL, i),
+                                                      strings, relations))
+        for relation_record in self.__relationRecords(first_relation, relation_count, relations):
+            syn_set.addRelation(self.createRelation(relation_record, strings))
+        return syn_set
+
+    def createExceptionalWord(self,
+                              exceptionRecord: tuple,
+                              strings: list = None) -> ExceptionalWord:
+        """
+        Creates an exceptional word from an exception record.
+
+        PARAMETERS
+        ----------
+        exceptionRecord : tuple
+            Fields of an exception record
+        strings : list
+            Decoded string table, if None strings are decoded one by one
+
+        RETURNS
+        -------
+        ExceptionalWord
+            Exceptional word described by the record
+        """
+        name, root, pos = exceptionRecord
+        if strings is not None:
+            return ExceptionalWord(strings[name], strings[root], WordNetSnapshot.POS_TAGS[pos])
+        return ExceptionalWord(self.string(name), self.string(root), WordNetSnapshot.POS_TAGS[pos])
+
+    @staticmethod
+    def fileChecksum(fileName: str) -> bytes:
+        """
+        Computes the SHA-256 digest of a file.
+
+        PARAMETERS
+        ----------
+        fileName : str
+            File whose checksum will be computed
+
+        RETURNS
+        -------
+        bytes
+            SHA-256 digest of the file contents
+        """
+        digest = hashlib.sha256()
+        with open(fileName, "rb") as input_file:
+            for block in iter(lambda: input_file.read(1 << 20), b""):
+                digest.update(block)
+        return digest.digest()
+
+    @staticmethod
+    def save(fileName: str,
+             checksum: bytes,
+             synSets: list,
+             literalList: dict,
+             interlingualList: dict,
+             exceptionList: dict):
+        """
+        Writes the given WordNet contents to a snapshot file.
+
+        PARAMETERS
+        ----------
+        fileName : str
+            Snapshot file to be written
+        checksum : bytes
+            SHA-256 digest of the XML file the WordNet was read from
+        synSets : list
+            SynSets in SynSet list order
+        literalList : dict
+            Literal name to literal list mapping of the WordNet
+        interlingualList : dict
+            Interlingual ID to SynSet list mapping of the WordNet
+        exceptionList : dict
+            Word to exceptional word list mapping of the WordNet
+        """
+        strings = {}
+
+        def stringIndex(value: str) -> int:
+            if value is None:
+                return WordNetSnapshot.NONE
+            if value not in strings:
+                strings[value] = len(strings)
+            return strings[value]
+
+        relation_records = []
+
+        def addRelations(owner) -> int:
+            first = len(relation_records)
+            for i in range(owner.relationSize()):
+                relation = owner.getRelation(i)
+                if isinstance(relation, InterlingualRelation):
+                    relation_type = relation.getType().value if relation.getType() is not None else 0
+                    relation_records.append(WordNetSnapshot.RELATION.pack(WordNetSnapshot.INTERLINGUAL_RELATION,
+                                                                          stringIndex(relation.getName()),
+                                                                          relation_type, 0))
+                elif isinstance(relation, SemanticRelation):
+                    relation_type = relation.getRelationType().value if relation.getRelationType() is not None else 0
+                    relation_records.append(WordNetSnapshot.RELATION.pack(WordNetSnapshot.SEMANTIC_RELATION,
+                                                                          stringIndex(relation.getName()),
+                                                                          relation_type, relation.toIndex()))
+            return first
+
+        literal_records = []
+        literal_indexes = {}
+
+        def addLiteral(literal: Literal):
+            literal_indexes[id(literal)] = len(literal_records)
+            literal_records.append(None)
+            first_relation = addRelations(literal)
+            literal_records[literal_indexes[id(literal)]] = WordNetSnapshot.LITERAL.pack(
+                stringIndex(literal.getName()), literal.getSense(), stringIndex(literal.getSynSetId()),
+                stringIndex(literal.getOrigin()), literal.getGroupNo(), first_relation, literal.relationSize())
+
+        syn_set_records = []
+        syn_set_indexes = {}
+        for syn_set in synSets:
+            syn_set_indexes[id(syn_set)] = len(syn_set_records)
+            first_literal = len(literal_records)
+            for i in range(syn_set.getSynonym().literalSize()):
+                addLiteral(syn_set.getSynonym().getLiteral(i))
+            first_relation = addRelations(syn_set)
+            pos = syn_set.getPos().value if syn_set.getPos() is not None else 0
+            bcs = syn_set.getBcs() if syn_set.getBcs() is not None else 0
+            syn_set_records.append(WordNetSnapshot.SYN_SET.pack(
+                stringIndex(syn_set.getId()), pos, stringIndex(syn_set.getLongDefinition()),
+                stringIndex(syn_set.getExample()), stringIndex(syn_set.getWikiPage()), stringIndex(syn_set.getNote()),
+                bcs, first_literal, syn_set.getSynonym().literalSize(), first_relation, syn_set.relationSize()))
+        literal_list_records = []
+        for literals in literalList.values():
+            for literal in literals:
+                if id(literal) not in literal_indexes:
+                    addLiteral(literal)
+                literal_list_records.append(WordNetSnapshot.OFFSET.pack(literal_indexes[id(literal)]))
+        interlingual_records = []
+        for interlingual_id in interlingualList:
+            for syn_set in interlingualList[interlingual_id]:
+                if id(syn_set) in syn_set_indexes:
+                    interlingual_records.append(WordNetSnapshot.INTERLINGUAL.pack(stringIndex(interlingual_id),
+                                                                                  syn_set_indexes[id(syn_set)]))
+        exception_records = []
+        for exceptional_words in exceptionList.values():
+            for exceptional_word in exceptional_words:
+                exception_records.append(WordNetSnapshot.EXCEPTION.pack(stringIndex(exceptional_word.getName()),
+                                                                        stringIndex(exceptional_word.getRoot()),
+                                                                        exceptional_word.getPos().value))
+        string_list = list(strings)
+        syn_set_index = sorted(range(len(syn_set_records)),
+                               key=lambda i: string_list[WordNetSnapshot.SYN_SET.unpack(syn_set_records[i])[0]])
+        literal_index = sorted((WordNetSnapshot.OFFSET.unpack(record)[0] for record in literal_list_records),
+                               key=lambda i: string_list[WordNetSnapshot.LITERAL.unpack(literal_records[i])[0]])
+        interlingual_index = sorted(range(len(interlingual_records)),
+                                    key=lambda i: string_list[WordNetSnapshot.INTERLINGUAL.unpack(
+                                        interlingual_records[i])[0]])
+        encoded = [value.encode("utf8") + b"\0" for value in string_list]
+        string_offsets = [0]
+        for value in encoded:
+            string_offsets.append(string_offsets[-1] + len(value))
+        sections = [(b"".join(WordNetSnapshot.OFFSET.pack(offset) for offset in string_offsets), len(encoded)),
+                    (b"".join(encoded), string_offsets[-1]),
+                    (b"".join(syn_set_records), len(syn_set_records)),
+                    (b"".join(literal_records), len(literal_records)),
+                    (b"".join(relation_records), len(relation_records)),
+                    (b"".join(literal_list_records), len(literal_list_records)),
+                    (b"".join(interlingual_records), len(interlingual_records)),
+                    (b"".join(exception_records), len(exception_records)),
+                    (b"".join(WordNetSnapshot.OFFSET.pack(i) for i in syn_set_index), len(syn_set_index)),
+                    (b"".join(WordNetSnapshot.OFFSET.pack(i) for i in literal_index), len(literal_index)),
+                    (b"".join(WordNetSnapshot.OFFSET.pack(i) for i in interlingual_index), len(interlingual_index))]
+        with open(fileName, "wb") as out_file:
+            out_file.write(WordNetSnapshot.HEADER.pack(WordNetSnapshot.MAGIC, WordNetSnapshot.VERSION, checksum))
+            offset = WordNetSnapshot.HEADER.size + WordNetSnapshot.SECTION_COUNT * WordNetSnapshot.SECTION.size
+            for data, count in sections:
+                out_file.write(WordNetSnapshot.SECTION.pack(offset, count))
+                offset += len(data)
+            for data, count in sections:
+                out_file.write(data)